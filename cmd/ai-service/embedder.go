@@ -0,0 +1,319 @@
+// Request-coalescing embedder for /embed and semantic-search candidates.
+// Concurrent callers within a short window are fused into one batched
+// backend call, amortizing HTTP overhead and letting the embedding model
+// run a true batched forward pass.
+package main
+
+import (
+	"crypto/sha256"
+	"encoding/base64"
+	"encoding/binary"
+	"encoding/hex"
+	"math"
+	"strconv"
+	"sync/atomic"
+	"time"
+
+	"github.com/hashicorp/golang-lru/v2"
+	"github.com/reflective-memory-kernel/internal/ai/local"
+	"go.uber.org/zap"
+)
+
+const (
+	// defaultEmbedBatchMax is the maximum number of texts fused into one
+	// backend call (override with EMBED_BATCH_MAX)
+	defaultEmbedBatchMax = 32
+	// defaultEmbedBatchWaitMs is how long the collector waits for more
+	// texts to arrive after the first one before flushing a partial batch
+	// (override with EMBED_BATCH_WAIT_MS)
+	defaultEmbedBatchWaitMs = 5
+	// embedCacheSize bounds the text-to-vector LRU shared by Embed and
+	// EmbedBatch, so identical texts across requests skip the backend.
+	// Embeddings are deterministic for a fixed model, so entries never
+	// go stale within a process lifetime and need no TTL.
+	embedCacheSize = 8192
+	// embedFlushConcurrency bounds how many flushed batches may be in
+	// flight at the backend at once
+	embedFlushConcurrency = 2
+)
+
+// embedBatchBuckets are the upper bounds of the batch-size histogram,
+// used to judge whether the coalescing window is actually filling batches
+var embedBatchBuckets = []int{1, 2, 4, 8, 16, 32}
+
+type embedResult struct {
+	embedding []float32
+	err       error
+}
+
+type embedJob struct {
+	text   string
+	key    string
+	result chan embedResult
+}
+
+// embedCacheKey hashes the text so the cache holds fixed-size keys
+// instead of whole documents
+func embedCacheKey(text string) string {
+	sum := sha256.Sum256([]byte(text))
+	return hex.EncodeToString(sum[:])
+}
+
+// batchingEmbedder coalesces concurrent Embed calls into batched backend
+// calls. A single background goroutine drains the job queue, so callers
+// only pay the channel handoff plus at most embedBatchWait of latency.
+type batchingEmbedder struct {
+	backend  *local.OllamaEmbedder
+	jobs     chan embedJob
+	maxBatch int
+	maxWait  time.Duration
+	cache    *lru.Cache[string, []float32]
+	logger   *zap.Logger
+
+	// batchHist[i] counts flushes whose size was <= embedBatchBuckets[i]
+	batchHist   [6]atomic.Int64
+	flushes     atomic.Int64
+	embedded    atomic.Int64
+	cacheHits   atomic.Int64
+	cacheMisses atomic.Int64
+}
+
+func newBatchingEmbedder(backend *local.OllamaEmbedder, logger *zap.Logger) *batchingEmbedder {
+	maxBatch := getEnvInt("EMBED_BATCH_MAX", defaultEmbedBatchMax)
+	if maxBatch < 1 {
+		maxBatch = 1
+	}
+	maxWait := getEnvInt("EMBED_BATCH_WAIT_MS", defaultEmbedBatchWaitMs)
+	if maxWait < 0 {
+		maxWait = 0
+	}
+
+	cache, _ := lru.New[string, []float32](embedCacheSize)
+	b := &batchingEmbedder{
+		backend:  backend,
+		jobs:     make(chan embedJob, maxBatch*4),
+		maxBatch: maxBatch,
+		maxWait:  time.Duration(maxWait) * time.Millisecond,
+		cache:    cache,
+		logger:   logger,
+	}
+	go b.run()
+	return b
+}
+
+// Embed queues the text and blocks until its batch is flushed. Texts seen
+// before are served straight from the LRU without touching the backend.
+func (b *batchingEmbedder) Embed(text string) ([]float32, error) {
+	key := embedCacheKey(text)
+	if embedding, ok := b.cache.Get(key); ok {
+		b.cacheHits.Add(1)
+		return embedding, nil
+	}
+	b.cacheMisses.Add(1)
+
+	result := make(chan embedResult, 1)
+	b.jobs <- embedJob{text: text, key: key, result: result}
+	r := <-result
+	return r.embedding, r.err
+}
+
+// EmbedBatch embeds texts directly in backend-sized batches, bypassing the
+// coalescing window since the caller already has the full batch in hand.
+// Cached texts are filled in locally; only the misses go to the backend.
+func (b *batchingEmbedder) EmbedBatch(texts []string) ([][]float32, error) {
+	embeddings := make([][]float32, len(texts))
+	missing := make([]string, 0, len(texts))
+	missingIdx := make([]int, 0, len(texts))
+	for i, text := range texts {
+		if embedding, ok := b.cache.Get(embedCacheKey(text)); ok {
+			b.cacheHits.Add(1)
+			embeddings[i] = embedding
+			continue
+		}
+		b.cacheMisses.Add(1)
+		missing = append(missing, text)
+		missingIdx = append(missingIdx, i)
+	}
+
+	for start := 0; start < len(missing); start += b.maxBatch {
+		end := min(start+b.maxBatch, len(missing))
+		batch, err := b.backend.EmbedBatch(missing[start:end])
+		if err != nil {
+			return nil, err
+		}
+		for j, embedding := range batch {
+			embeddings[missingIdx[start+j]] = embedding
+			b.cache.Add(embedCacheKey(missing[start+j]), embedding)
+		}
+	}
+	return embeddings, nil
+}
+
+// Dimension returns the embedding dimension of the backend model
+func (b *batchingEmbedder) Dimension() int {
+	return b.backend.Dimension()
+}
+
+// encodeFloat32Base64 packs a vector as base64 over little-endian float32
+// bytes: one contiguous buffer instead of a JSON float per element
+func encodeFloat32Base64(vec []float32) string {
+	buf := make([]byte, len(vec)*4)
+	for i, v := range vec {
+		binary.LittleEndian.PutUint32(buf[i*4:], math.Float32bits(v))
+	}
+	return base64.StdEncoding.EncodeToString(buf)
+}
+
+// decodeFloat32Base64 is the inverse of encodeFloat32Base64. Returns nil
+// if the payload is not valid base64 over whole float32 words.
+func decodeFloat32Base64(data string) []float32 {
+	buf, err := base64.StdEncoding.DecodeString(data)
+	if err != nil || len(buf)%4 != 0 {
+		return nil
+	}
+	vec := make([]float32, len(buf)/4)
+	for i := range vec {
+		vec[i] = math.Float32frombits(binary.LittleEndian.Uint32(buf[i*4:]))
+	}
+	return vec
+}
+
+// encodeFloat16Base64 packs a vector as base64 over little-endian IEEE
+// 754 half-precision bytes: half the float32 payload, with precision to
+// spare for unit-length embedding components
+func encodeFloat16Base64(vec []float32) string {
+	buf := make([]byte, len(vec)*2)
+	for i, v := range vec {
+		binary.LittleEndian.PutUint16(buf[i*2:], float16bits(v))
+	}
+	return base64.StdEncoding.EncodeToString(buf)
+}
+
+// float16bits converts a float32 to IEEE 754 binary16, rounding to
+// nearest and clamping overflow to infinity
+func float16bits(f float32) uint16 {
+	bits := math.Float32bits(f)
+	sign := uint16(bits>>16) & 0x8000
+	exp := int32(bits>>23&0xff) - 127 + 15
+	mant := bits & 0x7fffff
+
+	switch {
+	case exp >= 0x1f:
+		// Inf/NaN, or too large for half precision
+		if bits>>23&0xff == 0xff && mant != 0 {
+			return sign | 0x7e00
+		}
+		return sign | 0x7c00
+	case exp <= 0:
+		// Subnormal in half precision, or underflow to signed zero
+		if exp < -10 {
+			return sign
+		}
+		mant |= 0x800000
+		shift := uint32(14 - exp)
+		half := uint16(mant >> shift)
+		if mant>>(shift-1)&1 != 0 {
+			half++
+		}
+		return sign | half
+	}
+
+	half := sign | uint16(exp)<<10 | uint16(mant>>13)
+	if mant&0x1000 != 0 {
+		half++
+	}
+	return half
+}
+
+// encodeInt8Base64 packs a quantized vector as base64 over int8 bytes:
+// a quarter of the float32 payload for the same dimension
+func encodeInt8Base64(vec []int8) string {
+	buf := make([]byte, len(vec))
+	for i, v := range vec {
+		buf[i] = byte(v)
+	}
+	return base64.StdEncoding.EncodeToString(buf)
+}
+
+// run collects jobs into batches and flushes them to the backend.
+// Flushes run on their own goroutines (bounded by embedFlushConcurrency)
+// so the collector keeps filling the next batch while the previous one
+// is still at the backend, instead of stalling the queue per flush.
+func (b *batchingEmbedder) run() {
+	flightSem := make(chan struct{}, embedFlushConcurrency)
+	for job := range b.jobs {
+		batch := []embedJob{job}
+		timer := time.NewTimer(b.maxWait)
+	collect:
+		for len(batch) < b.maxBatch {
+			select {
+			case next := <-b.jobs:
+				batch = append(batch, next)
+			case <-timer.C:
+				break collect
+			}
+		}
+		timer.Stop()
+
+		flightSem <- struct{}{}
+		go func(batch []embedJob) {
+			defer func() { <-flightSem }()
+			b.flush(batch)
+		}(batch)
+	}
+}
+
+// stats reports flush counters and the batch-size histogram for tuning
+// the coalescing window
+func (b *batchingEmbedder) stats() map[string]interface{} {
+	hist := make(map[string]int64, len(embedBatchBuckets))
+	for i, bound := range embedBatchBuckets {
+		hist["le_"+strconv.Itoa(bound)] = b.batchHist[i].Load()
+	}
+	return map[string]interface{}{
+		"flushes":         b.flushes.Load(),
+		"texts_embedded":  b.embedded.Load(),
+		"batch_size_hist": hist,
+		"max_batch":       b.maxBatch,
+		"max_wait_ms":     b.maxWait.Milliseconds(),
+		"cache_hits":      b.cacheHits.Load(),
+		"cache_misses":    b.cacheMisses.Load(),
+		"cache_size":      b.cache.Len(),
+	}
+}
+
+// recordBatch updates the flush counters for one batch
+func (b *batchingEmbedder) recordBatch(size int) {
+	b.flushes.Add(1)
+	b.embedded.Add(int64(size))
+	for i, bound := range embedBatchBuckets {
+		if size <= bound {
+			b.batchHist[i].Add(1)
+			break
+		}
+	}
+}
+
+// flush issues one batched backend call and resolves every waiting job
+func (b *batchingEmbedder) flush(batch []embedJob) {
+	b.recordBatch(len(batch))
+
+	texts := make([]string, len(batch))
+	for i, job := range batch {
+		texts[i] = job.text
+	}
+
+	embeddings, err := b.backend.EmbedBatch(texts)
+	if err != nil {
+		b.logger.Warn("batched embedding failed", zap.Int("batch_size", len(batch)), zap.Error(err))
+		for _, job := range batch {
+			job.result <- embedResult{err: err}
+		}
+		return
+	}
+
+	for i, job := range batch {
+		b.cache.Add(job.key, embeddings[i])
+		job.result <- embedResult{embedding: embeddings[i]}
+	}
+}
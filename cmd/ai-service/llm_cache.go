@@ -0,0 +1,91 @@
+// Response caching for LLM-backed endpoints.
+// /expand-query and /synthesize are pure functions of their request body,
+// so a repeated request can reuse the previous JSON response and skip the
+// entire provider round trip.
+package main
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"strconv"
+	"sync/atomic"
+	"time"
+
+	"github.com/hashicorp/golang-lru/v2"
+	"github.com/reflective-memory-kernel/internal/server"
+)
+
+const (
+	// llmCacheSize bounds the number of cached responses per process
+	llmCacheSize = 256
+	// llmCacheTTL is how long a cached response stays valid
+	llmCacheTTL = 5 * time.Minute
+)
+
+type llmCacheEntry struct {
+	body      []byte
+	expiresAt time.Time
+}
+
+// llmCache memoizes serialized JSON response bodies keyed by a hash of the
+// endpoint name and raw request body. Entries expire after llmCacheTTL so
+// stale expansions/briefs age out under changing memory state.
+type llmCache struct {
+	entries *lru.Cache[string, llmCacheEntry]
+	hits    atomic.Int64
+	misses  atomic.Int64
+}
+
+func newLLMCache() *llmCache {
+	entries, _ := lru.New[string, llmCacheEntry](llmCacheSize)
+	return &llmCache{entries: entries}
+}
+
+// llmCacheKey derives the exact-match key from the endpoint name and the
+// raw request body bytes, so identical requests hash identically without
+// re-serializing the parsed struct.
+func llmCacheKey(endpoint string, body []byte) string {
+	h := sha256.New()
+	h.Write([]byte(endpoint))
+	h.Write([]byte{0})
+	h.Write(body)
+	return hex.EncodeToString(h.Sum(nil))
+}
+
+func (c *llmCache) get(key string) ([]byte, bool) {
+	entry, ok := c.entries.Get(key)
+	if ok && time.Now().Before(entry.expiresAt) {
+		c.hits.Add(1)
+		return entry.body, true
+	}
+	if ok {
+		c.entries.Remove(key)
+	}
+	c.misses.Add(1)
+	return nil, false
+}
+
+func (c *llmCache) set(key string, body []byte) {
+	c.entries.Add(key, llmCacheEntry{body: body, expiresAt: time.Now().Add(llmCacheTTL)})
+}
+
+// stats reports hit/miss counters for the debug endpoint
+func (c *llmCache) stats() map[string]int64 {
+	return map[string]int64{
+		"hits":   c.hits.Load(),
+		"misses": c.misses.Load(),
+	}
+}
+
+// cachedJSON rebuilds a response from a cached serialized body
+func cachedJSON(body []byte) *server.Response {
+	return &server.Response{
+		StatusCode: 200,
+		Headers: map[string]string{
+			"Content-Type":   "application/json",
+			"Content-Length": strconv.Itoa(len(body)),
+		},
+		Body:      body,
+		KeepAlive: true,
+	}
+}
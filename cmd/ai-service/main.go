@@ -4,18 +4,23 @@
 package main
 
 import (
+	"bytes"
 	"context"
-	"encoding/json"
+	"encoding/base64"
 	"fmt"
 	"log"
 	"os"
 	"strings"
+	"sync"
 	"time"
 
+	"github.com/hashicorp/golang-lru/v2"
 	"github.com/reflective-memory-kernel/internal/ai/curation"
+	"github.com/reflective-memory-kernel/internal/ai/local"
 	"github.com/reflective-memory-kernel/internal/ai/router"
 	"github.com/reflective-memory-kernel/internal/ai/synthesis"
 	"github.com/reflective-memory-kernel/internal/ingester"
+	"github.com/reflective-memory-kernel/internal/jsonx"
 	"github.com/reflective-memory-kernel/internal/server"
 	"github.com/reflective-memory-kernel/internal/validation"
 	"github.com/reflective-memory-kernel/internal/vectorindex"
@@ -29,7 +34,14 @@ type AIService struct {
 	synthesis   *synthesis.Service
 	ingester    *ingester.Service
 	vectorIndex *vectorindex.IndexBuilder
+	respCache   *llmCache
+	embedder    *batchingEmbedder
+	matrixCache *lru.Cache[string, *packedCandidates]
 	logger      *zap.Logger
+
+	// cognifyConcurrency is read from COGNIFY_CONCURRENCY once at startup
+	// instead of parsing the environment on every /cognify-batch request
+	cognifyConcurrency int
 }
 
 // Config holds the server configuration
@@ -67,14 +79,27 @@ func main() {
 
 	llmRouter := router.New(routerConfig, logger)
 
+	// Register as the process-wide router so every code path shares the
+	// same pooled HTTP client instead of creating its own instance
+	router.SetDefault(llmRouter)
+
 	// Initialize AI services
+	cognifyConcurrency := getEnvInt("COGNIFY_CONCURRENCY", 4)
+	if cognifyConcurrency < 1 {
+		cognifyConcurrency = 1
+	}
+
 	aiSvc := &AIService{
-		llmRouter:   llmRouter,
-		curation:    curation.New(llmRouter, logger),
-		synthesis:   synthesis.New(llmRouter, logger),
-		ingester:    ingester.New(nil, llmRouter, logger),
-		vectorIndex: vectorindex.NewIndexBuilder(10, 1536, logger),
-		logger:      logger,
+		llmRouter:          llmRouter,
+		curation:           curation.New(llmRouter, logger),
+		synthesis:          synthesis.New(llmRouter, logger),
+		ingester:           ingester.New(nil, llmRouter, logger),
+		vectorIndex:        vectorindex.NewIndexBuilder(10, 1536, logger),
+		respCache:          newLLMCache(),
+		embedder:           newBatchingEmbedder(local.NewOllamaEmbedder(cfg.OllamaURL, ""), logger),
+		matrixCache:        newCandidateMatrixCache(),
+		logger:             logger,
+		cognifyConcurrency: cognifyConcurrency,
 	}
 
 	// Create gnet engine
@@ -82,6 +107,7 @@ func main() {
 	opts := &server.Options{
 		Network:   "tcp",
 		Multicore: true,
+		ReusePort: true,
 		Logger:    logger,
 	}
 	engine := server.New(addr, opts)
@@ -95,6 +121,20 @@ func main() {
 		zap.Bool("glm_key", cfg.GLMKey != ""),
 	)
 
+	// Warm provider HTTPS connections so the first request skips the
+	// cold DNS + TLS handshake
+	warmupCtx, cancelWarmup := context.WithTimeout(context.Background(), 10*time.Second)
+	llmRouter.Warmup(warmupCtx)
+	cancelWarmup()
+
+	// Warm the embedding model in the background: the first real /embed
+	// otherwise pays Ollama's model load on top of its own latency
+	go func() {
+		if _, err := aiSvc.embedder.Embed("warmup"); err != nil {
+			logger.Debug("embedder warmup failed", zap.Error(err))
+		}
+	}()
+
 	// Start server
 	if err := engine.Start(); err != nil {
 		logger.Fatal("Server failed", zap.Error(err))
@@ -139,8 +179,10 @@ func setupRoutes(engine *server.Engine, svc *AIService) {
 	// Debug router
 	engine.GET("/debug-router", func(req *server.Request) *server.Response {
 		return server.JSON(map[string]any{
-			"service": "ai-service",
-			"status":  "running",
+			"service":        "ai-service",
+			"status":         "running",
+			"response_cache": svc.respCache.stats(),
+			"embed_batching": svc.embedder.stats(),
 		}, 200)
 	})
 
@@ -227,13 +269,40 @@ func setupRoutes(engine *server.Engine, svc *AIService) {
 
 	// Classify intent
 	engine.POST("/classify-intent", func(req *server.Request) *server.Response {
-		var r map[string]any
+		var r ClassifyIntentRequest
 		if err := server.ParseJSON(req, &r); err != nil {
 			return server.JSON(map[string]string{"error": "invalid request", "details": err.Error()}, 400)
 		}
 		return svc.classifyIntent(req, r)
 	})
 
+	// Text embedding (batched server-side across concurrent callers)
+	engine.POST("/embed", func(req *server.Request) *server.Response {
+		var r EmbedRequest
+		if err := server.ParseJSON(req, &r); err != nil {
+			return server.JSON(map[string]string{"error": "invalid request", "details": err.Error()}, 400)
+		}
+		return svc.embedText(req, r)
+	})
+
+	// Batched text embedding: one backend call for the whole list
+	engine.POST("/embed-batch", func(req *server.Request) *server.Response {
+		var r EmbedBatchRequest
+		if err := server.ParseJSON(req, &r); err != nil {
+			return server.JSON(map[string]string{"error": "invalid request", "details": err.Error()}, 400)
+		}
+		return svc.embedBatch(req, r)
+	})
+
+	// Text embedding with a binary payload for programmatic callers
+	engine.POST("/embed-binary", func(req *server.Request) *server.Response {
+		var r EmbedBinaryRequest
+		if err := server.ParseJSON(req, &r); err != nil {
+			return server.JSON(map[string]string{"error": "invalid request", "details": err.Error()}, 400)
+		}
+		return svc.embedTextBinary(req, r)
+	})
+
 	// Semantic search
 	engine.POST("/semantic-search", func(req *server.Request) *server.Response {
 		var r SemanticSearchRequest
@@ -260,6 +329,15 @@ func setupRoutes(engine *server.Engine, svc *AIService) {
 		}
 		return svc.summarizeBatch(req, r)
 	})
+
+	// Summarize global (L3 overview for migration)
+	engine.POST("/summarize-global", func(req *server.Request) *server.Response {
+		var r GlobalOverviewRequest
+		if err := server.ParseJSON(req, &r); err != nil {
+			return server.JSON(map[string]string{"error": "invalid request", "details": err.Error()}, 400)
+		}
+		return svc.summarizeGlobal(req, r)
+	})
 }
 
 // Request/Response types
@@ -386,6 +464,45 @@ type ResolveEntityResponse struct {
 	Match string `json:"match"`
 }
 
+type ClassifyIntentRequest struct {
+	Query string `json:"query"`
+}
+
+type EmbedRequest struct {
+	Text string `json:"text"`
+}
+
+type EmbedResponse struct {
+	Embedding []float32 `json:"embedding"`
+	Dimension int       `json:"dimension"`
+}
+
+type EmbedBatchRequest struct {
+	Texts []string `json:"texts"`
+}
+
+type EmbedBatchResponse struct {
+	Embeddings [][]float32 `json:"embeddings"`
+	Dimension  int         `json:"dimension"`
+}
+
+// EmbedBinaryRequest optionally narrows the wire dtype: "float16" halves
+// the payload, "int8" quarters it and adds a dequantization scale
+type EmbedBinaryRequest struct {
+	Text  string `json:"text"`
+	Dtype string `json:"dtype,omitempty"`
+}
+
+// EmbedBinaryResponse carries the embedding as base64 over little-endian
+// float32 bytes (or int8 bytes plus a scale when requested), avoiding a
+// JSON float per element on both ends
+type EmbedBinaryResponse struct {
+	Dtype string  `json:"dtype"`
+	Shape []int   `json:"shape"`
+	Data  string  `json:"data"`
+	Scale float32 `json:"scale,omitempty"`
+}
+
 type SemanticSearchRequest struct {
 	Query      string                 `json:"query"`
 	Candidates []map[string]interface{} `json:"candidates"`
@@ -426,6 +543,38 @@ type SummarizeBatchResponse struct {
 	Entities []ExtractedEntity `json:"entities"`
 }
 
+// CommunitySummaryInfo is one L2 community summary inside a global
+// overview request
+type CommunitySummaryInfo struct {
+	CommunityName string   `json:"community_name"`
+	CommunityType string   `json:"community_type"`
+	MemberCount   int      `json:"member_count"`
+	KeyMembers    []string `json:"key_members"`
+	Summary       string   `json:"summary"`
+	KeyFacts      []string `json:"key_facts"`
+	CommonSkills  []string `json:"common_skills"`
+}
+
+// GlobalOverviewRequest is the request for L3 global overview summarization
+type GlobalOverviewRequest struct {
+	Namespace          string                 `json:"namespace"`
+	CommunitySummaries []CommunitySummaryInfo `json:"community_summaries"`
+	TotalEntities      int                    `json:"total_entities"`
+	TotalRelationships int                    `json:"total_relationships"`
+}
+
+// GlobalOverviewResponse is the response for L3 global overview summarization
+type GlobalOverviewResponse struct {
+	Namespace        string   `json:"namespace"`
+	Title            string   `json:"title"`
+	ExecutiveSummary string   `json:"executive_summary"`
+	TotalEntities    int      `json:"total_entities"`
+	TotalCommunities int      `json:"total_communities"`
+	KeyInsights      []string `json:"key_insights"`
+	TopSkills        []string `json:"top_skills"`
+	CompressionRatio float64  `json:"compression_ratio"`
+}
+
 // Handler implementations
 
 // classifyEntity categorizes an entity and returns appropriate tags for policy enforcement
@@ -567,19 +716,21 @@ func (s *AIService) extractEntities(req *server.Request, r ExtractRequest) *serv
 	start := time.Now()
 	ctx := context.Background()
 
+	// Static instructions first, dynamic conversation last, so the
+	// provider's prefix cache covers the instruction block
 	prompt := fmt.Sprintf(`Extract entities from this conversation. Return JSON array:
 [{"name": "...", "type": "Person|Organization|Concept|Metric|Location", "description": "..."}]
 
-User Query: %s
-AI Response: %s
-Context: %s
-
 Focus on:
 - Named entities (people, organizations, locations)
 - Concepts and topics
 - Metrics and measurements
 - Relationships mentioned
 
+User Query: %s
+AI Response: %s
+Context: %s
+
 JSON:`, r.UserQuery, r.AIResponse, orDefault(r.Context, "None"))
 
 	// Use default provider (auto-detects based on available API keys)
@@ -589,9 +740,6 @@ JSON:`, r.UserQuery, r.AIResponse, orDefault(r.Context, "None"))
 		return server.JSON([]ExtractedEntity{}, 200)
 	}
 
-	// Debug: log the result map
-	s.logger.Info("extraction result", zap.Any("result", result))
-
 	entities := []ExtractedEntity{}
 
 	// Try multiple possible keys for the entity array
@@ -601,7 +749,6 @@ JSON:`, r.UserQuery, r.AIResponse, orDefault(r.Context, "None"))
 		if arr, ok := result[key].([]interface{}); ok {
 			entityArray = arr
 			found = true
-			s.logger.Info("found entity array", zap.String("key", key), zap.Int("length", len(arr)))
 			break
 		}
 	}
@@ -634,9 +781,8 @@ JSON:`, r.UserQuery, r.AIResponse, orDefault(r.Context, "None"))
 		s.logger.Warn("no entity array in result", zap.Any("keys", getMapKeys(result)))
 	}
 
-	s.logger.Info("extracted entities with classification",
+	s.logger.Debug("extracted entities with classification",
 		zap.Int("count", len(entities)),
-		zap.Any("sample", getSampleEntities(entities)),
 		zap.Duration("duration", time.Since(start)))
 
 	return server.JSON(entities, 200)
@@ -661,21 +807,6 @@ func getTagsFromArray(m map[string]interface{}, key string) []string {
 	return nil
 }
 
-// getSampleEntities returns a sample of entities for logging
-func getSampleEntities(entities []ExtractedEntity) []map[string]interface{} {
-	sample := make([]map[string]interface{}, 1, 3)
-	for i, e := range entities {
-		if i >= 3 {
-			break
-		}
-		sample = append(sample, map[string]interface{}{
-			"name": e.Name,
-			"tags": e.Tags,
-		})
-	}
-	return sample
-}
-
 func (s *AIService) curateFacts(req *server.Request, r CurationRequest) *server.Response {
 	ctx := context.Background()
 
@@ -711,6 +842,12 @@ func (s *AIService) curateFacts(req *server.Request, r CurationRequest) *server.
 func (s *AIService) synthesizeBrief(req *server.Request, r SynthesisRequest) *server.Response {
 	ctx := context.Background()
 
+	// Identical synthesis requests within the TTL reuse the prior brief
+	cacheKey := llmCacheKey("synthesize", req.Body)
+	if body, ok := s.respCache.get(cacheKey); ok {
+		return cachedJSON(body)
+	}
+
 	synthesizeReq := &synthesis.SynthesisRequest{
 		Query:    r.Query,
 		Context:  r.Context,
@@ -728,10 +865,12 @@ func (s *AIService) synthesizeBrief(req *server.Request, r SynthesisRequest) *se
 		}, 200)
 	}
 
-	return server.JSON(SynthesisResponse{
+	resp := server.JSON(SynthesisResponse{
 		Brief:      result.Brief,
 		Confidence: result.Confidence,
 	}, 200)
+	s.respCache.set(cacheKey, resp.Body)
+	return resp
 }
 
 func (s *AIService) synthesizeInsight(req *server.Request, r InsightRequest) *server.Response {
@@ -767,13 +906,14 @@ func (s *AIService) synthesizeInsight(req *server.Request, r InsightRequest) *se
 func (s *AIService) generateResponse(req *server.Request, r GenerateRequest) *server.Response {
 	ctx := context.Background()
 
-	// Build context string
-	var contextBuilder strings.Builder
-	if r.Context != "" {
-		contextBuilder.WriteString(r.Context)
-	}
+	// Reuse the request's context string as-is when there is nothing to
+	// append: contexts can be multi-KB, and a copy would stay resident
+	// for the whole LLM round trip on every in-flight request
+	contextStr := r.Context
 	if len(r.ProactiveAlerts) > 0 {
-		if contextBuilder.Len() > 0 {
+		var contextBuilder strings.Builder
+		if r.Context != "" {
+			contextBuilder.WriteString(r.Context)
 			contextBuilder.WriteString("\n\n")
 		}
 		contextBuilder.WriteString("Alerts:\n")
@@ -782,11 +922,12 @@ func (s *AIService) generateResponse(req *server.Request, r GenerateRequest) *se
 			contextBuilder.WriteString(alert)
 			contextBuilder.WriteString("\n")
 		}
+		contextStr = contextBuilder.String()
 	}
 
 	genReq := &router.GenerateRequest{
 		Query:       r.Query,
-		Context:     contextBuilder.String(),
+		Context:     contextStr,
 		Alerts:      r.ProactiveAlerts,
 		UserAPIKeys: r.UserAPIKeys,
 		// Don't set SystemInstruction - let the router build it using buildSystemPrompt
@@ -802,21 +943,32 @@ func (s *AIService) generateResponse(req *server.Request, r GenerateRequest) *se
 	return server.JSON(GenerateResponse{Response: result.Content}, 200)
 }
 
-func (s *AIService) expandQuery(req *server.Request, r ExpandQueryRequest) *server.Response {
-	ctx := context.Background()
-
-	prompt := fmt.Sprintf(`Extract entity names and search terms from this query.
+// expandQueryPrompt is the /expand-query template. The instruction block
+// stays byte-identical across calls with only the query appended at the
+// end, so providers with prefix caching skip re-processing it.
+const expandQueryPrompt = `Extract entity names and search terms from the query at the end.
 Return JSON: {"search_terms": ["term1", "term2"], "entity_names": ["Name1", "Name2"]}
 
-Query: "%s"
-
 Rules:
 - search_terms: keywords to search (e.g., "metal", "favorite", "cat")
 - entity_names: specific names that might be stored (e.g., "Platinum", "Luna", "Emma")
 - Be thorough but concise
 - Return ONLY the JSON, no explanation
 
-JSON:`, r.Query)
+Query: "%s"
+
+JSON:`
+
+func (s *AIService) expandQuery(req *server.Request, r ExpandQueryRequest) *server.Response {
+	ctx := context.Background()
+
+	// Repeated queries hit the response cache and skip the LLM entirely
+	cacheKey := llmCacheKey("expand-query", req.Body)
+	if body, ok := s.respCache.get(cacheKey); ok {
+		return cachedJSON(body)
+	}
+
+	prompt := fmt.Sprintf(expandQueryPrompt, r.Query)
 
 	result, err := s.llmRouter.ExtractJSON(ctx, prompt, router.ProviderNVIDIA, "")
 	if err != nil {
@@ -856,11 +1008,13 @@ JSON:`, r.Query)
 		}
 	}
 
-	return server.JSON(ExpandQueryResponse{
+	resp := server.JSON(ExpandQueryResponse{
 		OriginalQuery: r.Query,
 		SearchTerms:   searchTerms,
 		EntityNames:   entityNames,
 	}, 200)
+	s.respCache.set(cacheKey, resp.Body)
+	return resp
 }
 
 func (s *AIService) extractVision(req *server.Request, r VisionExtractRequest) *server.Response {
@@ -907,13 +1061,20 @@ Return as JSON:
 		RawResponse: rawResponse,
 	}
 
-	// Simple JSON extraction
+	// Balanced-brace extraction: one forward pass that stops at the first
+	// complete object, instead of a first-{ to last-} span that swallows
+	// any prose after the JSON and fails to parse
 	jsonStart := strings.Index(rawResponse, "{")
-	jsonEnd := strings.LastIndex(rawResponse, "}")
+	jsonEnd := -1
+	if jsonStart >= 0 {
+		if end := findBalancedObject(rawResponse[jsonStart:]); end >= 0 {
+			jsonEnd = jsonStart + end
+		}
+	}
 	if jsonStart >= 0 && jsonEnd > jsonStart {
 		jsonStr := rawResponse[jsonStart : jsonEnd+1]
 		var parsed map[string]interface{}
-		if err := json.Unmarshal([]byte(jsonStr), &parsed); err == nil {
+		if err := jsonx.UnmarshalFromString(jsonStr, &parsed); err == nil {
 			if entities, ok := parsed["entities"].([]interface{}); ok {
 				for _, e := range entities {
 					if entityMap, ok := e.(map[string]interface{}); ok {
@@ -945,10 +1106,24 @@ Return as JSON:
 func (s *AIService) ingestDocument(req *server.Request, r IngestRequest) *server.Response {
 	ctx := context.Background()
 
+	// Decode once up front; validation and ingestion both reuse the
+	// decoded bytes instead of each decoding the base64 payload again
+	var content []byte
+	if r.ContentBase64 != "" {
+		decoded, err := base64.StdEncoding.DecodeString(r.ContentBase64)
+		if err != nil {
+			return server.JSON(map[string]any{
+				"error":   "File validation failed",
+				"details": "Invalid base64 encoding: " + err.Error(),
+			}, 400)
+		}
+		content = decoded
+	}
+
 	// Validate file if provided
-	if r.ContentBase64 != "" && r.Filename != "" {
+	if len(content) > 0 && r.Filename != "" {
 		validator := validation.DefaultConfig()
-		validationResult := validator.ValidateBase64Content(r.ContentBase64, r.Filename)
+		validationResult := validator.ValidateContent(content, r.Filename)
 		if !validationResult.Valid {
 			s.logger.Warn("file validation failed",
 				zap.String("error", validationResult.ErrorMessage))
@@ -974,7 +1149,7 @@ func (s *AIService) ingestDocument(req *server.Request, r IngestRequest) *server
 				docType = "text"
 			}
 		}
-		result, err = s.ingester.IngestBase64Content(ctx, r.ContentBase64, docType, r.Filename)
+		result, err = s.ingester.IngestContent(ctx, content, docType, r.Filename)
 	} else {
 		return server.JSON(map[string]any{"error": "Either text or content_base64 is required"}, 400)
 	}
@@ -1087,10 +1262,10 @@ JSON:`, r.Entity, candidatesBuilder.String())
 	return server.JSON(ResolveEntityResponse{Match: match}, 200)
 }
 
-func (s *AIService) classifyIntent(req *server.Request, r map[string]any) *server.Response {
+func (s *AIService) classifyIntent(req *server.Request, r ClassifyIntentRequest) *server.Response {
 	ctx := context.Background()
 
-	query := getString(r, "query")
+	query := r.Query
 	if query == "" {
 		return server.JSON(map[string]any{"error": "query is required"}, 400)
 	}
@@ -1138,28 +1313,179 @@ Return ONLY the category name, nothing else.`
 	return server.JSON(map[string]string{"intent": finalIntent}, 200)
 }
 
-func (s *AIService) semanticSearch(req *server.Request, r SemanticSearchRequest) *server.Response {
-	// Placeholder implementation
-	return server.JSON(SemanticSearchResponse{Results: []map[string]interface{}{}}, 200)
+func (s *AIService) embedText(req *server.Request, r EmbedRequest) *server.Response {
+	if r.Text == "" {
+		return server.JSON(map[string]string{"error": "text is required"}, 400)
+	}
+
+	embedding, err := s.embedder.Embed(r.Text)
+	if err != nil {
+		s.logger.Warn("embedding failed", zap.Error(err))
+		return server.JSON(map[string]string{"error": err.Error()}, 502)
+	}
+
+	return server.JSON(EmbedResponse{
+		Embedding: embedding,
+		Dimension: len(embedding),
+	}, 200)
+}
+
+func (s *AIService) embedBatch(req *server.Request, r EmbedBatchRequest) *server.Response {
+	if len(r.Texts) == 0 {
+		return server.JSON(map[string]string{"error": "texts is required"}, 400)
+	}
+
+	embeddings, err := s.embedder.EmbedBatch(r.Texts)
+	if err != nil {
+		s.logger.Warn("batch embedding failed", zap.Error(err))
+		return server.JSON(map[string]string{"error": err.Error()}, 502)
+	}
+
+	dimension := 0
+	if len(embeddings) > 0 {
+		dimension = len(embeddings[0])
+	}
+
+	return server.JSON(EmbedBatchResponse{
+		Embeddings: embeddings,
+		Dimension:  dimension,
+	}, 200)
+}
+
+func (s *AIService) embedTextBinary(req *server.Request, r EmbedBinaryRequest) *server.Response {
+	if r.Text == "" {
+		return server.JSON(map[string]string{"error": "text is required"}, 400)
+	}
+
+	embedding, err := s.embedder.Embed(r.Text)
+	if err != nil {
+		s.logger.Warn("embedding failed", zap.Error(err))
+		return server.JSON(map[string]string{"error": err.Error()}, 502)
+	}
+
+	// Narrower dtypes shrink the payload; vectors are unit-length so the
+	// reduced precision is plenty for similarity scoring
+	switch r.Dtype {
+	case "int8":
+		quantized, scale := quantize(embedding)
+		return server.JSON(EmbedBinaryResponse{
+			Dtype: "int8",
+			Shape: []int{len(quantized)},
+			Data:  encodeInt8Base64(quantized),
+			Scale: scale,
+		}, 200)
+	case "float16":
+		return server.JSON(EmbedBinaryResponse{
+			Dtype: "float16",
+			Shape: []int{len(embedding)},
+			Data:  encodeFloat16Base64(embedding),
+		}, 200)
+	}
+
+	return server.JSON(EmbedBinaryResponse{
+		Dtype: "float32",
+		Shape: []int{len(embedding)},
+		Data:  encodeFloat32Base64(embedding),
+	}, 200)
 }
 
+// cognifyBatchSize is the number of items extracted per LLM call
+const cognifyBatchSize = 8
+
 func (s *AIService) cognifyBatch(req *server.Request, r CognifyBatchRequest) *server.Response {
 	ctx := context.Background()
 
-	results := []CognifyResult{}
+	// Group items so each LLM round trip extracts several at once, and
+	// issue the groups concurrently so total latency is bounded by the
+	// slowest group rather than the sum of all of them
+	sem := make(chan struct{}, s.cognifyConcurrency)
+
+	results := make([]CognifyResult, len(r.Items))
+	var wg sync.WaitGroup
+
+	for batchStart := 0; batchStart < len(r.Items); batchStart += cognifyBatchSize {
+		batchEnd := min(batchStart+cognifyBatchSize, len(r.Items))
+		wg.Add(1)
+		go func(offset int, batch []CognifyItem) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			for i, result := range s.extractCognifyBatch(ctx, batch) {
+				results[offset+i] = result
+			}
+		}(batchStart, r.Items[batchStart:batchEnd])
+	}
+	wg.Wait()
+
+	// NDJSON on request: one JSON document per line lets the client
+	// decode results incrementally instead of materializing the whole
+	// array, and the server skips marshaling one monolithic value.
+	// (The gnet response layer is fully buffered, so this is a framing
+	// change, not chunked transfer.)
+	if wantsNDJSON(req) {
+		var buf bytes.Buffer
+		for i := range results {
+			line, err := server.JSONMarshal(&results[i])
+			if err != nil {
+				continue
+			}
+			buf.Write(line)
+			buf.WriteByte('\n')
+		}
+		return &server.Response{
+			StatusCode: 200,
+			Headers: map[string]string{
+				"Content-Type":   "application/x-ndjson",
+				"Content-Length": fmt.Sprintf("%d", buf.Len()),
+			},
+			Body:      buf.Bytes(),
+			KeepAlive: true,
+		}
+	}
 
-	for _, item := range r.Items {
-		// Extract entities from content
-		entities := s.extractEntitiesFromContent(ctx, item.Content, item.SourceTable)
+	return server.JSON(results, 200)
+}
+
+// wantsNDJSON reports whether the client asked for newline-delimited
+// JSON via the Accept header
+func wantsNDJSON(req *server.Request) bool {
+	accept := req.Headers["Accept"]
+	if accept == "" {
+		accept = req.Headers["accept"]
+	}
+	return strings.Contains(accept, "application/x-ndjson")
+}
+
+// extractCognifyBatch runs one grouped extraction call and maps the
+// parsed entities back to their source items
+func (s *AIService) extractCognifyBatch(ctx context.Context, batch []CognifyItem) []CognifyResult {
+	prompts := make([]string, len(batch))
+	for i, item := range batch {
+		prompts[i] = cognifyPrompt(item.Content, item.SourceTable)
+	}
+
+	batchResults, err := s.llmRouter.ExtractJSONBatch(ctx, prompts, router.ProviderNVIDIA, "")
+	if err != nil {
+		s.logger.Warn("batch extraction failed", zap.Error(err))
+		batchResults = make([]map[string]interface{}, len(batch))
+	}
 
+	results := make([]CognifyResult, len(batch))
+	for i, item := range batch {
 		extractedEntities := []ExtractedEntity{}
-		for _, e := range entities {
-			extractedEntities = append(extractedEntities, ExtractedEntity{
-				Name:        e["name"],
-				Type:        e["type"],
-				Description: e["description"],
-				Tags:        []string{item.SourceTable, "imported"},
-			})
+		if batchResults[i] != nil {
+			if entityArray, ok := batchResults[i]["entities"].([]interface{}); ok {
+				for _, e := range entityArray {
+					if entityMap, ok := e.(map[string]interface{}); ok {
+						extractedEntities = append(extractedEntities, ExtractedEntity{
+							Name:        getString(entityMap, "name"),
+							Type:        getString(entityMap, "type"),
+							Description: getString(entityMap, "description"),
+							Tags:        []string{item.SourceTable, "imported"},
+						})
+					}
+				}
+			}
 		}
 
 		if len(extractedEntities) == 0 {
@@ -1171,13 +1497,25 @@ func (s *AIService) cognifyBatch(req *server.Request, r CognifyBatchRequest) *se
 			})
 		}
 
-		results = append(results, CognifyResult{
+		results[i] = CognifyResult{
 			SourceID: item.SourceID,
 			Entities: extractedEntities,
-		})
+		}
 	}
 
-	return server.JSON(results, 200)
+	return results
+}
+
+// cognifyPrompt builds the extraction prompt for a single cognify item
+func cognifyPrompt(content, sourceTable string) string {
+	return fmt.Sprintf(`Extract entities from this text. Return JSON:
+{"entities": [{"name": "...", "type": "Person|Organization|Concept|Metric", "description": "..."}]}
+
+Text: %s
+
+Source: %s
+
+JSON:`, content, sourceTable)
 }
 
 // summarizeBatch handles wisdom layer crystallization - extracts entities from conversation
@@ -1185,11 +1523,11 @@ func (s *AIService) summarizeBatch(req *server.Request, r SummarizeBatchRequest)
 	start := time.Now()
 	ctx := context.Background()
 
-	// Build extraction prompt for conversation
-	prompt := fmt.Sprintf(`Analyze this conversation and extract meaningful entities and facts. Return JSON.
-
-Conversation:
-%s
+	// Build extraction prompt for conversation. The static instruction
+	// block comes first and the conversation last so providers that cache
+	// by message-boundary prefix can reuse the KV cache of the
+	// instructions across calls.
+	prompt := fmt.Sprintf(`Analyze the conversation at the end of this message and extract meaningful entities and facts. Return JSON.
 
 INSTRUCTIONS:
 1. Extract entities that represent important information shared by the user
@@ -1216,6 +1554,9 @@ IMPORTANT:
 - Be specific in descriptions
 - The source_text should be a direct quote from the user's message
 
+Conversation:
+%s
+
 JSON:`, r.Text)
 
 	// Use LLM to extract
@@ -1260,7 +1601,7 @@ JSON:`, r.Text)
 		}
 	}
 
-	s.logger.Info("summarize_batch completed",
+	s.logger.Debug("summarize_batch completed",
 		zap.Int("entity_count", len(entities)),
 		zap.String("summary_preview", summary[:min(50, len(summary))]),
 		zap.Duration("duration", time.Since(start)))
@@ -1271,40 +1612,137 @@ JSON:`, r.Text)
 	}, 200)
 }
 
-func (s *AIService) extractEntitiesFromContent(ctx context.Context, content, sourceTable string) []map[string]string {
-	prompt := fmt.Sprintf(`Extract entities from this text. Return JSON array:
-[{"name": "...", "type": "Person|Organization|Concept|Metric", "description": "..."}]
-
-Text: %s
+const (
+	// globalOverviewTopSkills caps how many skills the overview reports
+	globalOverviewTopSkills = 10
+	// globalOverviewKeyFacts caps how many community facts become insights
+	globalOverviewKeyFacts = 5
+)
 
-Source: %s
+// summarizeGlobal handles L3 summarization: a deterministic aggregation
+// of the L2 community summaries, no LLM call needed
+func (s *AIService) summarizeGlobal(req *server.Request, r GlobalOverviewRequest) *server.Response {
+	nCommunities := len(r.CommunitySummaries)
+
+	// Count skills in one pass, keeping first-seen order for stable ties
+	skillCounts := make(map[string]int)
+	skillOrder := []string{}
+	keyFacts := []string{}
+	for _, community := range r.CommunitySummaries {
+		for _, skill := range community.CommonSkills {
+			if _, seen := skillCounts[skill]; !seen {
+				skillOrder = append(skillOrder, skill)
+			}
+			skillCounts[skill]++
+		}
+		keyFacts = append(keyFacts, community.KeyFacts...)
+	}
 
-JSON:`, content, sourceTable)
+	insights := []string{
+		fmt.Sprintf("Total entities: %d", r.TotalEntities),
+		fmt.Sprintf("Communities: %d", nCommunities),
+	}
+	seen := make(map[string]struct{}, len(insights))
+	for _, insight := range insights {
+		seen[insight] = struct{}{}
+	}
+	for _, fact := range keyFacts {
+		if len(insights) >= 2+globalOverviewKeyFacts {
+			break
+		}
+		if _, ok := seen[fact]; ok {
+			continue
+		}
+		seen[fact] = struct{}{}
+		insights = append(insights, fact)
+	}
 
-	result, err := s.llmRouter.ExtractJSON(ctx, prompt, router.ProviderNVIDIA, "")
-	if err != nil {
-		s.logger.Warn("batch extraction failed", zap.Error(err))
-		return []map[string]string{}
+	compressionRatio := 0.0
+	if nCommunities > 0 {
+		compressionRatio = float64(r.TotalEntities) / float64(nCommunities)
 	}
 
-	entities := []map[string]string{}
-	if entityArray, ok := result["entities"].([]interface{}); ok {
-		for _, item := range entityArray {
-			if entityMap, ok := item.(map[string]interface{}); ok {
-				entities = append(entities, map[string]string{
-					"name":        getString(entityMap, "name"),
-					"type":        getString(entityMap, "type"),
-					"description": getString(entityMap, "description"),
-				})
+	return server.JSON(GlobalOverviewResponse{
+		Namespace:        r.Namespace,
+		Title:            fmt.Sprintf("Overview: %s", r.Namespace),
+		ExecutiveSummary: fmt.Sprintf("Dataset contains %d entities organized into %d communities covering %d distinct skills.", r.TotalEntities, nCommunities, len(skillCounts)),
+		TotalEntities:    r.TotalEntities,
+		TotalCommunities: nCommunities,
+		KeyInsights:      insights,
+		TopSkills:        topCountedSkills(skillOrder, skillCounts, globalOverviewTopSkills),
+		CompressionRatio: compressionRatio,
+	}, 200)
+}
+
+// topCountedSkills selects the k most frequent skills by repeated
+// selection instead of sorting every unique skill for a fixed-size
+// result; ties keep first-seen order
+func topCountedSkills(order []string, counts map[string]int, k int) []string {
+	if k > len(order) {
+		k = len(order)
+	}
+	taken := make([]bool, len(order))
+	top := make([]string, 0, k)
+	for len(top) < k {
+		best := -1
+		for i, skill := range order {
+			if taken[i] {
+				continue
+			}
+			if best < 0 || counts[skill] > counts[order[best]] {
+				best = i
 			}
 		}
+		taken[best] = true
+		top = append(top, order[best])
 	}
-
-	return entities
+	return top
 }
 
 // Helper functions
 
+// findBalancedObject returns the index of the brace matching s[0] ('{'),
+// skipping braces inside JSON strings, or -1 if the text is unbalanced
+func findBalancedObject(s string) int {
+	if len(s) == 0 || s[0] != '{' {
+		return -1
+	}
+
+	depth := 0
+	inString := false
+	escaped := false
+
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+
+		if inString {
+			switch {
+			case escaped:
+				escaped = false
+			case c == '\\':
+				escaped = true
+			case c == '"':
+				inString = false
+			}
+			continue
+		}
+
+		switch c {
+		case '"':
+			inString = true
+		case '{':
+			depth++
+		case '}':
+			depth--
+			if depth == 0 {
+				return i
+			}
+		}
+	}
+
+	return -1
+}
+
 func getString(m map[string]interface{}, key string) string {
 	if v, ok := m[key]; ok {
 		if s, ok := v.(string); ok {
@@ -0,0 +1,314 @@
+// Semantic search over caller-provided candidates.
+// Candidate vectors are packed into one flat float32 matrix and scored
+// with a tight dot-product loop, then the top-k are selected without
+// sorting the full score slice.
+package main
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"math"
+	"strconv"
+
+	"github.com/hashicorp/golang-lru/v2"
+	"github.com/reflective-memory-kernel/internal/server"
+	"go.uber.org/zap"
+)
+
+const (
+	// semanticSearchDefaultTopK is returned when the request omits top_k
+	semanticSearchDefaultTopK = 5
+	// semanticSearchDefaultThreshold filters weak matches when the request
+	// omits threshold
+	semanticSearchDefaultThreshold = 0.3
+	// candidateMatrixCacheSize bounds how many packed candidate sets are
+	// kept for reuse across searches
+	candidateMatrixCacheSize = 16
+)
+
+// packedCandidates is a quantized candidate matrix ready for scoring,
+// cached so repeated searches over the same candidate set skip packing,
+// normalization, and any re-embedding of candidates without vectors
+type packedCandidates struct {
+	matrix []int8
+	scales []float32
+	kept   []int
+}
+
+func newCandidateMatrixCache() *lru.Cache[string, *packedCandidates] {
+	cache, _ := lru.New[string, *packedCandidates](candidateMatrixCacheSize)
+	return cache
+}
+
+// candidateSetKey hashes the identity of a candidate set. Candidates are
+// identified by id and text, which is what determines their vectors.
+func candidateSetKey(candidates []map[string]interface{}, dim int) string {
+	h := sha256.New()
+	h.Write([]byte(strconv.Itoa(dim)))
+	for _, candidate := range candidates {
+		if id, ok := candidate["id"].(string); ok {
+			h.Write([]byte(id))
+		}
+		h.Write([]byte{0})
+		if text, ok := candidate["text"].(string); ok {
+			h.Write([]byte(text))
+		}
+		h.Write([]byte{0})
+	}
+	return hex.EncodeToString(h.Sum(nil))
+}
+
+func (s *AIService) semanticSearch(req *server.Request, r SemanticSearchRequest) *server.Response {
+	if r.Query == "" || len(r.Candidates) == 0 {
+		return server.JSON(SemanticSearchResponse{Results: []map[string]interface{}{}}, 200)
+	}
+
+	topK := r.TopK
+	if topK <= 0 {
+		topK = semanticSearchDefaultTopK
+	}
+	threshold := float32(r.Threshold)
+	if r.Threshold == 0 {
+		threshold = semanticSearchDefaultThreshold
+	}
+
+	// Embed the query in the background while the candidate matrix is
+	// looked up or packed; the two waits overlap instead of adding up
+	queryCh := make(chan embedResult, 1)
+	go func() {
+		vec, err := s.embedder.Embed(r.Query)
+		queryCh <- embedResult{embedding: vec, err: err}
+	}()
+
+	dim := s.embedder.Dimension()
+	packed, errResp := s.packedForDim(r.Candidates, dim)
+	if errResp != nil {
+		return errResp
+	}
+
+	q := <-queryCh
+	if q.err != nil {
+		s.logger.Warn("query embedding failed", zap.Error(q.err))
+		return server.JSON(map[string]string{"error": q.err.Error()}, 502)
+	}
+	query := q.embedding
+	if len(query) != dim {
+		// Backend disagrees with the configured model dimension; repack
+		// against what it actually returned (cold path)
+		s.logger.Warn("embedding dimension mismatch",
+			zap.Int("configured", dim), zap.Int("actual", len(query)))
+		dim = len(query)
+		if packed, errResp = s.packedForDim(r.Candidates, dim); errResp != nil {
+			return errResp
+		}
+	}
+	matrix, scales, kept := packed.matrix, packed.scales, packed.kept
+	if len(kept) == 0 {
+		return server.JSON(SemanticSearchResponse{Results: []map[string]interface{}{}}, 200)
+	}
+
+	// One pass over a contiguous int8 matrix: a quarter of the bytes of
+	// float32, which is what matters for this memory-bound scan. Vectors
+	// are unit-length before quantization, so the rescaled integer dot
+	// product approximates the cosine similarity.
+	queryQ, queryScale := quantize(query)
+	scores := make([]float32, len(kept))
+	for i := range kept {
+		scores[i] = float32(dotInt8(queryQ, matrix[i*dim:(i+1)*dim])) * queryScale * scales[i]
+	}
+
+	results := []map[string]interface{}{}
+	for _, idx := range topKIndices(scores, topK) {
+		if scores[idx] < threshold {
+			break
+		}
+		result := make(map[string]interface{}, len(r.Candidates[kept[idx]])+1)
+		for k, v := range r.Candidates[kept[idx]] {
+			result[k] = v
+		}
+		result["score"] = scores[idx]
+		results = append(results, result)
+	}
+
+	return server.JSON(SemanticSearchResponse{Results: results}, 200)
+}
+
+// packedForDim returns the cached or freshly packed candidate matrix for
+// the given embedding dimension. Orchestrator loops query the same
+// candidate set repeatedly, so the packed matrix is reused when the set
+// is unchanged.
+func (s *AIService) packedForDim(candidates []map[string]interface{}, dim int) (*packedCandidates, *server.Response) {
+	setKey := candidateSetKey(candidates, dim)
+	if packed, ok := s.matrixCache.Get(setKey); ok {
+		return packed, nil
+	}
+
+	matrix, scales, kept, err := s.packCandidates(candidates, dim)
+	if err != nil {
+		s.logger.Warn("candidate embedding failed", zap.Error(err))
+		return nil, server.JSON(map[string]string{"error": err.Error()}, 502)
+	}
+	packed := &packedCandidates{matrix: matrix, scales: scales, kept: kept}
+	s.matrixCache.Add(setKey, packed)
+	return packed, nil
+}
+
+// packCandidates builds a flat row-major (N x dim) int8 matrix of
+// L2-normalized candidate vectors with one dequantization scale per row.
+// Candidates that ship an "embedding" field are used as-is; the rest are
+// embedded in one batched backend call. Returns the matrix, the per-row
+// scales, and the original indices of the candidates that made it in.
+func (s *AIService) packCandidates(candidates []map[string]interface{}, dim int) ([]int8, []float32, []int, error) {
+	matrix := make([]int8, 0, len(candidates)*dim)
+	scales := make([]float32, 0, len(candidates))
+	kept := make([]int, 0, len(candidates))
+
+	appendRow := func(vec []float32, idx int) {
+		row, scale := quantize(vec)
+		matrix = append(matrix, row...)
+		scales = append(scales, scale)
+		kept = append(kept, idx)
+	}
+
+	// Candidates missing an embedding are collected for one batched call;
+	// identical texts are embedded once and shared by every candidate
+	// that carries them
+	missingTexts := []string{}
+	missingIdx := [][]int{}
+	textSlot := map[string]int{}
+
+	for i, candidate := range candidates {
+		if vec := floatSlice(candidate["embedding"]); len(vec) == dim {
+			appendRow(normalize(vec), i)
+			continue
+		}
+		if text, ok := candidate["text"].(string); ok && text != "" {
+			slot, seen := textSlot[text]
+			if !seen {
+				slot = len(missingTexts)
+				textSlot[text] = slot
+				missingTexts = append(missingTexts, text)
+				missingIdx = append(missingIdx, nil)
+			}
+			missingIdx[slot] = append(missingIdx[slot], i)
+		}
+	}
+
+	if len(missingTexts) > 0 {
+		embeddings, err := s.embedder.EmbedBatch(missingTexts)
+		if err != nil {
+			return nil, nil, nil, err
+		}
+		for j, vec := range embeddings {
+			if len(vec) == dim {
+				for _, idx := range missingIdx[j] {
+					appendRow(vec, idx)
+				}
+			}
+		}
+	}
+
+	return matrix, scales, kept, nil
+}
+
+// quantize maps a float32 vector to int8 with a single dequantization
+// scale, chosen so the largest-magnitude component maps to +/-127
+func quantize(vec []float32) ([]int8, float32) {
+	var maxAbs float32
+	for _, v := range vec {
+		if v < 0 {
+			v = -v
+		}
+		if v > maxAbs {
+			maxAbs = v
+		}
+	}
+	if maxAbs == 0 {
+		return make([]int8, len(vec)), 0
+	}
+
+	scale := maxAbs / 127
+	quantized := make([]int8, len(vec))
+	for i, v := range vec {
+		quantized[i] = int8(math.RoundToEven(float64(v / scale)))
+	}
+	return quantized, scale
+}
+
+// dotInt8 computes an integer dot product with int32 accumulation
+func dotInt8(a, b []int8) int32 {
+	var s0, s1, s2, s3 int32
+	n := len(a)
+	i := 0
+	for ; i+4 <= n; i += 4 {
+		s0 += int32(a[i]) * int32(b[i])
+		s1 += int32(a[i+1]) * int32(b[i+1])
+		s2 += int32(a[i+2]) * int32(b[i+2])
+		s3 += int32(a[i+3]) * int32(b[i+3])
+	}
+	for ; i < n; i++ {
+		s0 += int32(a[i]) * int32(b[i])
+	}
+	return s0 + s1 + s2 + s3
+}
+
+// floatSlice converts a candidate embedding into a float32 vector. It
+// accepts either a JSON float array or the base64 binary form produced
+// by /embed-binary.
+func floatSlice(v interface{}) []float32 {
+	if data, ok := v.(string); ok {
+		return decodeFloat32Base64(data)
+	}
+	arr, ok := v.([]interface{})
+	if !ok {
+		return nil
+	}
+	vec := make([]float32, len(arr))
+	for i, item := range arr {
+		f, ok := item.(float64)
+		if !ok {
+			return nil
+		}
+		vec[i] = float32(f)
+	}
+	return vec
+}
+
+// normalize L2-normalizes a vector in place and returns it
+func normalize(vec []float32) []float32 {
+	var sumSq float32
+	for _, v := range vec {
+		sumSq += v * v
+	}
+	norm := float32(math.Sqrt(float64(sumSq)))
+	if norm > 1e-9 {
+		for i := range vec {
+			vec[i] /= norm
+		}
+	}
+	return vec
+}
+
+// topKIndices returns the indices of the k highest scores in descending
+// order, using selection over the score slice instead of a full sort
+func topKIndices(scores []float32, k int) []int {
+	if k > len(scores) {
+		k = len(scores)
+	}
+	taken := make([]bool, len(scores))
+	indices := make([]int, 0, k)
+	for len(indices) < k {
+		best := -1
+		for i, score := range scores {
+			if taken[i] {
+				continue
+			}
+			if best < 0 || score > scores[best] {
+				best = i
+			}
+		}
+		taken[best] = true
+		indices = append(indices, best)
+	}
+	return indices
+}
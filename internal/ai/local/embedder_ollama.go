@@ -30,6 +30,18 @@ type OllamaEmbeddingResponse struct {
 	Embedding []float64 `json:"embedding"`
 }
 
+// OllamaBatchEmbeddingRequest is the request payload for Ollama's batched
+// embedding API (/api/embed), which accepts a list of inputs
+type OllamaBatchEmbeddingRequest struct {
+	Model string   `json:"model"`
+	Input []string `json:"input"`
+}
+
+// OllamaBatchEmbeddingResponse is the response from /api/embed
+type OllamaBatchEmbeddingResponse struct {
+	Embeddings [][]float64 `json:"embeddings"`
+}
+
 // NewOllamaEmbedder creates a new Ollama-based embedder
 func NewOllamaEmbedder(baseURL, model string) *OllamaEmbedder {
 	if baseURL == "" {
@@ -90,15 +102,70 @@ func (e *OllamaEmbedder) Embed(text string) ([]float32, error) {
 		return nil, fmt.Errorf("empty embedding returned")
 	}
 
-	// Convert float64 to float32 and normalize
-	embedding := make([]float32, len(result.Embedding))
+	return normalizeEmbedding(result.Embedding), nil
+}
+
+// EmbedBatch generates embeddings for multiple texts in a single API call.
+// Ollama's /api/embed endpoint accepts a list input and runs one batched
+// forward pass, which is much faster than one HTTP round trip per text.
+func (e *OllamaEmbedder) EmbedBatch(texts []string) ([][]float32, error) {
+	if len(texts) == 0 {
+		return nil, nil
+	}
+
+	reqBody := OllamaBatchEmbeddingRequest{
+		Model: e.model,
+		Input: texts,
+	}
+
+	jsonData, err := json.Marshal(reqBody)
+	if err != nil {
+		return nil, fmt.Errorf("failed to marshal request: %w", err)
+	}
+
+	req, err := http.NewRequest("POST", e.baseURL+"/api/embed", bytes.NewBuffer(jsonData))
+	if err != nil {
+		return nil, fmt.Errorf("failed to create request: %w", err)
+	}
+	req.Header.Set("Content-Type", "application/json")
+
+	resp, err := e.httpClient.Do(req)
+	if err != nil {
+		return nil, fmt.Errorf("failed to call Ollama API: %w", err)
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode != http.StatusOK {
+		body, _ := io.ReadAll(resp.Body)
+		return nil, fmt.Errorf("Ollama API error (status %d): %s", resp.StatusCode, string(body))
+	}
+
+	var result OllamaBatchEmbeddingResponse
+	if err := json.NewDecoder(resp.Body).Decode(&result); err != nil {
+		return nil, fmt.Errorf("failed to decode response: %w", err)
+	}
+
+	if len(result.Embeddings) != len(texts) {
+		return nil, fmt.Errorf("expected %d embeddings, got %d", len(texts), len(result.Embeddings))
+	}
+
+	embeddings := make([][]float32, len(result.Embeddings))
+	for i, raw := range result.Embeddings {
+		embeddings[i] = normalizeEmbedding(raw)
+	}
+
+	return embeddings, nil
+}
+
+// normalizeEmbedding converts float64 to float32 and L2-normalizes
+func normalizeEmbedding(raw []float64) []float32 {
+	embedding := make([]float32, len(raw))
 	var sumSq float64
-	for i, v := range result.Embedding {
+	for i, v := range raw {
 		embedding[i] = float32(v)
 		sumSq += v * v
 	}
 
-	// L2 normalize
 	norm := float32(math.Sqrt(sumSq))
 	if norm > 1e-9 {
 		for i := range embedding {
@@ -106,7 +173,7 @@ func (e *OllamaEmbedder) Embed(text string) ([]float32, error) {
 		}
 	}
 
-	return embedding, nil
+	return embedding
 }
 
 // EnsureModel pulls the embedding model if not already present
@@ -0,0 +1,102 @@
+// Image payload reduction for vision requests.
+// Providers downscale large images server-side anyway, so shipping a
+// full-resolution capture only inflates bytes-on-wire and TLS write time.
+package router
+
+import (
+	"bytes"
+	"encoding/base64"
+	"image"
+	"image/jpeg"
+	_ "image/png" // register PNG decoder
+
+	"go.uber.org/zap"
+)
+
+const (
+	// visionMaxEdge is the longest edge sent to vision providers
+	visionMaxEdge = 1024
+	// visionJPEGQuality is the re-encode quality for shrunk images
+	visionJPEGQuality = 85
+	// visionShrinkThreshold is the base64 payload size below which we
+	// skip re-encoding entirely (already cheap to send)
+	visionShrinkThreshold = 100 * 1024
+)
+
+// shrinkImageBase64 downscales and recompresses a base64 image payload.
+// Returns the original payload unchanged when it is already small, when
+// decoding fails, or when re-encoding does not actually shrink it.
+func shrinkImageBase64(imageB64 string) string {
+	if len(imageB64) < visionShrinkThreshold {
+		return imageB64
+	}
+
+	raw, err := base64.StdEncoding.DecodeString(imageB64)
+	if err != nil {
+		return imageB64
+	}
+
+	img, _, err := image.Decode(bytes.NewReader(raw))
+	if err != nil {
+		return imageB64
+	}
+
+	img = scaleDown(img, visionMaxEdge)
+
+	var buf bytes.Buffer
+	if err := jpeg.Encode(&buf, img, &jpeg.Options{Quality: visionJPEGQuality}); err != nil {
+		return imageB64
+	}
+
+	if buf.Len() >= len(raw) {
+		return imageB64
+	}
+
+	return base64.StdEncoding.EncodeToString(buf.Bytes())
+}
+
+// scaleDown resizes an image so its longest edge is at most maxEdge,
+// using nearest-neighbor sampling. Returns the input unchanged if it
+// already fits.
+func scaleDown(img image.Image, maxEdge int) image.Image {
+	bounds := img.Bounds()
+	w, h := bounds.Dx(), bounds.Dy()
+
+	longest := w
+	if h > longest {
+		longest = h
+	}
+	if longest <= maxEdge {
+		return img
+	}
+
+	scale := float64(maxEdge) / float64(longest)
+	newW := int(float64(w) * scale)
+	newH := int(float64(h) * scale)
+	if newW < 1 {
+		newW = 1
+	}
+	if newH < 1 {
+		newH = 1
+	}
+
+	dst := image.NewRGBA(image.Rect(0, 0, newW, newH))
+	for y := 0; y < newH; y++ {
+		srcY := bounds.Min.Y + y*h/newH
+		for x := 0; x < newW; x++ {
+			srcX := bounds.Min.X + x*w/newW
+			dst.Set(x, y, img.At(srcX, srcY))
+		}
+	}
+
+	return dst
+}
+
+// logShrink logs the payload reduction when debug logging is enabled
+func (r *Router) logShrink(before, after int) {
+	if after < before {
+		r.logger.Debug("shrunk vision image payload",
+			zap.Int("before_bytes", before),
+			zap.Int("after_bytes", after))
+	}
+}
@@ -6,8 +6,10 @@ import (
 	"bytes"
 	"context"
 	"encoding/base64"
+	"errors"
 	"fmt"
 	"io"
+	"net"
 	"net/http"
 	"os"
 	"regexp"
@@ -16,6 +18,7 @@ import (
 	"sync"
 	"time"
 
+	"github.com/hashicorp/golang-lru/v2"
 	"github.com/reflective-memory-kernel/internal/jsonx"
 	"go.uber.org/zap"
 )
@@ -81,6 +84,22 @@ func getEnvOrDefault(key, defaultValue string) string {
 	return defaultValue
 }
 
+// Circuit breaker settings: after circuitThreshold consecutive qualifying
+// failures a provider is skipped for circuitCooldown before being retried.
+const (
+	circuitThreshold = 3
+	circuitCooldown  = 30 * time.Second
+)
+
+// circuitState tracks consecutive failures for one provider
+type circuitState struct {
+	consecutiveFailures int
+	openedAt            time.Time
+}
+
+// fallbackOrder is the provider priority used when building a fallback chain
+var fallbackOrder = []Provider{ProviderGLM, ProviderNVIDIA, ProviderOpenAI, ProviderAnthropic, ProviderOllama}
+
 // Router handles LLM request routing to multiple providers
 type Router struct {
 	config  *Config
@@ -91,6 +110,45 @@ type Router struct {
 	// Runtime state
 	providers      map[Provider]bool
 	defaultProvider Provider
+	circuit        map[Provider]*circuitState
+
+	// Memoized system prompts keyed by (context, alerts); multi-turn
+	// sessions rebuild the same prompt on every call otherwise
+	promptCache *lru.Cache[string, string]
+}
+
+// defaultRouter is the process-wide shared router instance.
+// All callers should share one router so they reuse a single pooled
+// http.Client (TCP/TLS connections) instead of duplicating pools.
+var (
+	defaultRouter   *Router
+	defaultRouterMu sync.RWMutex
+)
+
+// SetDefault registers the process-wide router instance.
+// Typically called once at startup with the fully configured router.
+func SetDefault(r *Router) {
+	defaultRouterMu.Lock()
+	defaultRouter = r
+	defaultRouterMu.Unlock()
+}
+
+// Default returns the process-wide router, creating one from
+// DefaultConfig on first use if none has been registered.
+func Default() *Router {
+	defaultRouterMu.RLock()
+	r := defaultRouter
+	defaultRouterMu.RUnlock()
+	if r != nil {
+		return r
+	}
+
+	defaultRouterMu.Lock()
+	defer defaultRouterMu.Unlock()
+	if defaultRouter == nil {
+		defaultRouter = New(DefaultConfig(), nil)
+	}
+	return defaultRouter
 }
 
 // New creates a new LLM router
@@ -115,7 +173,9 @@ func New(cfg *Config, logger *zap.Logger) *Router {
 		logger:         logger,
 		providers:      make(map[Provider]bool),
 		defaultProvider: cfg.DefaultProvider,
+		circuit:        make(map[Provider]*circuitState),
 	}
+	r.promptCache, _ = lru.New[string, string](512)
 
 	// Determine available providers
 	if cfg.GLMKey != "" {
@@ -139,6 +199,46 @@ func New(cfg *Config, logger *zap.Logger) *Router {
 	return r
 }
 
+// Warmup pre-establishes HTTPS connections to the configured providers so
+// the first real request reuses a warm keepalive slot instead of paying
+// DNS resolution and the TLS handshake on the critical path.
+// Errors are ignored; this is purely best-effort.
+func (r *Router) Warmup(ctx context.Context) {
+	endpoints := map[Provider]string{
+		ProviderGLM:       "https://open.bigmodel.cn/api/paas/v4/chat/completions",
+		ProviderNVIDIA:    "https://integrate.api.nvidia.com/v1/models",
+		ProviderOpenAI:    "https://api.openai.com/v1/models",
+		ProviderAnthropic: "https://api.anthropic.com/v1/messages",
+	}
+
+	var wg sync.WaitGroup
+	for provider, url := range endpoints {
+		if !r.providers[provider] {
+			continue
+		}
+
+		wg.Add(1)
+		go func(provider Provider, url string) {
+			defer wg.Done()
+
+			req, err := http.NewRequestWithContext(ctx, "HEAD", url, nil)
+			if err != nil {
+				return
+			}
+
+			resp, err := r.client.Do(req)
+			if err != nil {
+				r.logger.Debug("connection warmup failed",
+					zap.String("provider", string(provider)),
+					zap.Error(err))
+				return
+			}
+			resp.Body.Close()
+		}(provider, url)
+	}
+	wg.Wait()
+}
+
 // GenerateRequest represents a generation request
 type GenerateRequest struct {
 	Query           string            `json:"query"`
@@ -193,74 +293,188 @@ func (r *Router) Generate(ctx context.Context, req *GenerateRequest) (*GenerateR
 		system = r.buildSystemPrompt(req.Context, req.Alerts)
 	}
 
-	// Route to appropriate provider
+	// Build the fallback chain: requested provider first, then the
+	// remaining available providers in priority order. On a qualifying
+	// failure (timeout, 429, 5xx) we advance to the next provider instead
+	// of surfacing the error to the caller.
+	chain := r.buildChain(provider)
+
 	var content string
 	var err error
 
+	for i, p := range chain {
+		if i > 0 && !r.circuitAllows(p) {
+			r.logger.Debug("skipping provider with open circuit", zap.String("provider", string(p)))
+			continue
+		}
+
+		content, err = r.callProvider(ctx, p, system, req)
+		if err == nil {
+			r.recordSuccess(p)
+			provider = p
+			break
+		}
+
+		r.recordFailure(p)
+
+		if !isRetryableError(err) || i == len(chain)-1 {
+			return nil, fmt.Errorf("provider %s failed: %w", p, err)
+		}
+
+		r.logger.Warn("provider failed, trying fallback",
+			zap.String("provider", string(p)),
+			zap.Error(err))
+	}
+
+	if err != nil {
+		return nil, fmt.Errorf("all providers failed: %w", err)
+	}
+
+	// Strip thinking tags if present
+	content = stripThinkingTags(content)
+
+	return &GenerateResponse{
+		Content:  content,
+		Provider: provider,
+		Model:    req.Model,
+		Duration: time.Since(start),
+	}, nil
+}
+
+// buildChain returns the providers to try in order, starting with the
+// preferred provider and falling back to the remaining available ones
+func (r *Router) buildChain(preferred Provider) []Provider {
+	r.mu.RLock()
+	defer r.mu.RUnlock()
+
+	chain := make([]Provider, 0, len(fallbackOrder))
+	if r.providers[preferred] {
+		chain = append(chain, preferred)
+	}
+	for _, p := range fallbackOrder {
+		if p != preferred && r.providers[p] {
+			chain = append(chain, p)
+		}
+	}
+	return chain
+}
+
+// callProvider dispatches a single generation call to one provider
+func (r *Router) callProvider(ctx context.Context, provider Provider, system string, req *GenerateRequest) (string, error) {
+	model := req.Model
+
 	switch provider {
 	case ProviderGLM:
 		apiKey := r.getAPIKey(req.UserAPIKeys, "glm", r.config.GLMKey)
-		model := req.Model
 		if model == "" {
 			model = "glm-4.5"
 		}
-		content, err = r.callGLM(ctx, system, req.Query, model, apiKey)
+		return r.callGLM(ctx, system, req.Query, model, apiKey)
 
 	case ProviderNVIDIA:
 		apiKey := r.getAPIKey(req.UserAPIKeys, "nim", r.config.NVIDIAKey)
-		model := req.Model
 		if model == "" {
 			model = "meta/llama-3.1-70b-instruct"
 		}
-		content, err = r.callNVIDIA(ctx, system, req.Query, model, apiKey)
+		return r.callNVIDIA(ctx, system, req.Query, model, apiKey)
 
 	case ProviderOpenAI:
 		apiKey := r.getAPIKey(req.UserAPIKeys, "openai", r.config.OpenAIKey)
-		model := req.Model
 		if model == "" {
 			model = "gpt-4o-mini"
 		}
-		content, err = r.callOpenAI(ctx, system, req.Query, model, apiKey)
+		return r.callOpenAI(ctx, system, req.Query, model, apiKey)
 
 	case ProviderAnthropic:
 		apiKey := r.getAPIKey(req.UserAPIKeys, "anthropic", r.config.AnthropicKey)
-		model := req.Model
 		if model == "" {
 			model = "claude-3-haiku-20240307"
 		}
-		content, err = r.callAnthropic(ctx, system, req.Query, model, apiKey)
+		return r.callAnthropic(ctx, system, req.Query, model, apiKey)
 
 	case ProviderOllama:
-		model := req.Model
 		if model == "" {
 			model = "llama3.2"
 		}
-		content, err = r.callOllama(ctx, system, req.Query, model)
+		return r.callOllama(ctx, system, req.Query, model)
 
 	default:
-		// Try fallback
-		if r.providers[ProviderGLM] {
-			content, err = r.callGLM(ctx, system, req.Query, "glm-4-plus", r.config.GLMKey)
-			provider = ProviderGLM
-		} else {
-			content, err = r.callOllama(ctx, system, req.Query, "llama3.2")
-			provider = ProviderOllama
+		return "", fmt.Errorf("unknown provider: %s", provider)
+	}
+}
+
+// circuitAllows reports whether a provider's circuit is closed (or has
+// cooled down enough to be retried)
+func (r *Router) circuitAllows(provider Provider) bool {
+	r.mu.RLock()
+	defer r.mu.RUnlock()
+
+	state, ok := r.circuit[provider]
+	if !ok || state.consecutiveFailures < circuitThreshold {
+		return true
+	}
+	return time.Since(state.openedAt) >= circuitCooldown
+}
+
+// recordSuccess closes the circuit for a provider
+func (r *Router) recordSuccess(provider Provider) {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	delete(r.circuit, provider)
+}
+
+// recordFailure counts a failure and opens the circuit at the threshold
+func (r *Router) recordFailure(provider Provider) {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+
+	state, ok := r.circuit[provider]
+	if !ok {
+		state = &circuitState{}
+		r.circuit[provider] = state
+	}
+	state.consecutiveFailures++
+	if state.consecutiveFailures == circuitThreshold {
+		state.openedAt = time.Now()
+	}
+}
+
+// apiError is a non-200 response from a provider API
+type apiError struct {
+	status int
+	body   string
+}
+
+func (e *apiError) Error() string {
+	return fmt.Sprintf("API error (status %d): %s", e.status, e.body)
+}
+
+// isRetryableError reports whether an error qualifies for provider fallback:
+// timeouts, rate limits (429), and upstream server errors (5xx)
+func isRetryableError(err error) bool {
+	var apiErr *apiError
+	if errors.As(err, &apiErr) {
+		switch apiErr.status {
+		case http.StatusTooManyRequests,
+			http.StatusInternalServerError,
+			http.StatusBadGateway,
+			http.StatusServiceUnavailable,
+			http.StatusGatewayTimeout:
+			return true
 		}
+		return false
 	}
 
-	if err != nil {
-		return nil, fmt.Errorf("provider %s failed: %w", provider, err)
+	if errors.Is(err, context.DeadlineExceeded) {
+		return true
 	}
 
-	// Strip thinking tags if present
-	content = stripThinkingTags(content)
+	var netErr net.Error
+	if errors.As(err, &netErr) && netErr.Timeout() {
+		return true
+	}
 
-	return &GenerateResponse{
-		Content:  content,
-		Provider: provider,
-		Model:    req.Model,
-		Duration: time.Since(start),
-	}, nil
+	return false
 }
 
 // VisionRequest represents a vision generation request
@@ -277,6 +491,11 @@ func (r *Router) GenerateVision(ctx context.Context, req *VisionRequest) (string
 		model = "minimaxai/minimax-m2"
 	}
 
+	// Downscale oversized images before they hit the wire
+	imageB64 := shrinkImageBase64(req.ImageBase64)
+	r.logShrink(len(req.ImageBase64), len(imageB64))
+	req = &VisionRequest{ImageBase64: imageB64, Prompt: req.Prompt, Model: req.Model}
+
 	// Try NVIDIA first if available
 	if r.config.NVIDIAKey != "" {
 		content, err := r.callNVIDIAVision(ctx, req.Prompt, req.ImageBase64, model)
@@ -313,8 +532,76 @@ func (r *Router) ExtractJSON(ctx context.Context, prompt string, provider Provid
 	return parseJSONFromResponse(resp.Content)
 }
 
-// buildSystemPrompt builds the system prompt with context and alerts
+// ExtractJSONBatch runs several extraction prompts in a single LLM call,
+// returning one result map per prompt. Amortizes the HTTP round trip and
+// system-prompt tokens across the whole batch.
+func (r *Router) ExtractJSONBatch(ctx context.Context, prompts []string, provider Provider, model string) ([]map[string]interface{}, error) {
+	if len(prompts) == 0 {
+		return nil, nil
+	}
+	if len(prompts) == 1 {
+		result, err := r.ExtractJSON(ctx, prompts[0], provider, model)
+		if err != nil {
+			return nil, err
+		}
+		return []map[string]interface{}{result}, nil
+	}
+
+	var combined strings.Builder
+	combined.WriteString("Process each numbered task below independently.\n")
+	combined.WriteString("Return ONLY a JSON array where element i is the JSON result for task i, in order.\n")
+	for i, p := range prompts {
+		fmt.Fprintf(&combined, "\n### Task %d\n%s\n", i+1, p)
+	}
+
+	req := &GenerateRequest{
+		Query:             combined.String(),
+		Provider:          provider,
+		Model:             model,
+		SystemInstruction: "You are a precise entity extraction engine. Output a JSON array only.",
+	}
+
+	resp, err := r.Generate(ctx, req)
+	if err != nil {
+		return nil, err
+	}
+
+	parsed, err := parseJSONFromResponse(resp.Content)
+	if err != nil {
+		return nil, err
+	}
+
+	items, ok := parsed["items"].([]interface{})
+	if !ok {
+		return nil, fmt.Errorf("batch extraction did not return a JSON array")
+	}
+
+	results := make([]map[string]interface{}, len(prompts))
+	for i := range results {
+		results[i] = make(map[string]interface{})
+		if i < len(items) {
+			if m, ok := items[i].(map[string]interface{}); ok {
+				results[i] = m
+			}
+		}
+	}
+	return results, nil
+}
+
+// buildSystemPrompt builds the system prompt with context and alerts,
+// memoizing the result since context and alerts rarely change mid-session
 func (r *Router) buildSystemPrompt(context string, alerts []string) string {
+	key := context + "\x00" + strings.Join(alerts, "\x00")
+	if cached, ok := r.promptCache.Get(key); ok {
+		return cached
+	}
+
+	result := buildSystemPromptUncached(context, alerts)
+	r.promptCache.Add(key, result)
+	return result
+}
+
+func buildSystemPromptUncached(context string, alerts []string) string {
 	var prompt strings.Builder
 
 	prompt.WriteString("You are a helpful AI assistant with access to the user's personal memory database. ")
@@ -353,19 +640,44 @@ func (r *Router) getAPIKey(userKeys map[string]string, keyName string, defaultKe
 	return defaultKey
 }
 
+// chatMessage is one message in an OpenAI-style chat request
+type chatMessage struct {
+	Role    string `json:"role"`
+	Content string `json:"content"`
+}
+
+// chatRequest is the OpenAI-compatible request body shared by GLM,
+// NVIDIA, OpenAI, and Ollama. A fixed-shape struct lets the JSON encoder
+// skip the reflection and boxing overhead of per-call interface maps.
+type chatRequest struct {
+	Model       string        `json:"model"`
+	Messages    []chatMessage `json:"messages"`
+	MaxTokens   int           `json:"max_tokens,omitempty"`
+	Temperature float64       `json:"temperature,omitempty"`
+	Stream      bool          `json:"stream"`
+}
+
+// anthropicRequest is the Anthropic Messages API request body
+type anthropicRequest struct {
+	Model     string        `json:"model"`
+	MaxTokens int           `json:"max_tokens"`
+	System    string        `json:"system"`
+	Messages  []chatMessage `json:"messages"`
+}
+
 // callGLM calls the GLM (Zhipu AI) API
 func (r *Router) callGLM(ctx context.Context, system, query, model, apiKey string) (string, error) {
 	if apiKey == "" {
 		return "", fmt.Errorf("no GLM API key available")
 	}
 
-	reqBody := map[string]interface{}{
-		"model": model,
-		"messages": []map[string]string{
-			{"role": "system", "content": system},
-			{"role": "user", "content": query},
+	reqBody := &chatRequest{
+		Model: model,
+		Messages: []chatMessage{
+			{Role: "system", Content: system},
+			{Role: "user", Content: query},
 		},
-		"max_tokens": 1000,
+		MaxTokens: 1000,
 	}
 
 	return r.makeRequest(ctx, "https://open.bigmodel.cn/api/paas/v4/chat/completions", reqBody, map[string]string{
@@ -374,23 +686,61 @@ func (r *Router) callGLM(ctx context.Context, system, query, model, apiKey strin
 	})
 }
 
+// Pre-serialized segments of the NVIDIA request body. Only the three
+// string values change between calls, so the structural JSON is built
+// once and the dynamic values are spliced in pre-escaped.
+var (
+	nvidiaBodySeg1 = []byte(`{"model":`)
+	nvidiaBodySeg2 = []byte(`,"messages":[{"role":"system","content":`)
+	nvidiaBodySeg3 = []byte(`},{"role":"user","content":`)
+	nvidiaBodySeg4 = []byte(`}],"max_tokens":1024,"temperature":0.7,"stream":false}`)
+)
+
+// buildNVIDIABody assembles the fixed-shape NVIDIA request body by
+// concatenating the static segments with JSON-escaped dynamic values,
+// skipping a full encoder tree traversal per call
+func buildNVIDIABody(model, system, query string) ([]byte, error) {
+	modelJSON, err := jsonx.Marshal(model)
+	if err != nil {
+		return nil, err
+	}
+	systemJSON, err := jsonx.Marshal(system)
+	if err != nil {
+		return nil, err
+	}
+	queryJSON, err := jsonx.Marshal(query)
+	if err != nil {
+		return nil, err
+	}
+
+	size := len(nvidiaBodySeg1) + len(modelJSON) +
+		len(nvidiaBodySeg2) + len(systemJSON) +
+		len(nvidiaBodySeg3) + len(queryJSON) +
+		len(nvidiaBodySeg4)
+
+	body := make([]byte, 0, size)
+	body = append(body, nvidiaBodySeg1...)
+	body = append(body, modelJSON...)
+	body = append(body, nvidiaBodySeg2...)
+	body = append(body, systemJSON...)
+	body = append(body, nvidiaBodySeg3...)
+	body = append(body, queryJSON...)
+	body = append(body, nvidiaBodySeg4...)
+	return body, nil
+}
+
 // callNVIDIA calls the NVIDIA NIM API
 func (r *Router) callNVIDIA(ctx context.Context, system, query, model, apiKey string) (string, error) {
 	if apiKey == "" {
 		return "", fmt.Errorf("no NVIDIA API key available")
 	}
 
-	reqBody := map[string]interface{}{
-		"model": model,
-		"messages": []map[string]string{
-			{"role": "system", "content": system},
-			{"role": "user", "content": query},
-		},
-		"max_tokens":  1024,
-		"temperature": 0.7,
+	body, err := buildNVIDIABody(model, system, query)
+	if err != nil {
+		return "", fmt.Errorf("failed to marshal request: %w", err)
 	}
 
-	return r.makeRequest(ctx, "https://integrate.api.nvidia.com/v1/chat/completions", reqBody, map[string]string{
+	return r.makeRequestBytes(ctx, "https://integrate.api.nvidia.com/v1/chat/completions", body, map[string]string{
 		"Authorization": "Bearer " + apiKey,
 		"Content-Type":  "application/json",
 	})
@@ -450,13 +800,13 @@ func (r *Router) callOpenAI(ctx context.Context, system, query, model, apiKey st
 		return "", fmt.Errorf("no OpenAI API key available")
 	}
 
-	reqBody := map[string]interface{}{
-		"model": model,
-		"messages": []map[string]string{
-			{"role": "system", "content": system},
-			{"role": "user", "content": query},
+	reqBody := &chatRequest{
+		Model: model,
+		Messages: []chatMessage{
+			{Role: "system", Content: system},
+			{Role: "user", Content: query},
 		},
-		"max_tokens": 1000,
+		MaxTokens: 1000,
 	}
 
 	return r.makeRequest(ctx, "https://api.openai.com/v1/chat/completions", reqBody, map[string]string{
@@ -471,12 +821,12 @@ func (r *Router) callAnthropic(ctx context.Context, system, query, model, apiKey
 		return "", fmt.Errorf("no Anthropic API key available")
 	}
 
-	reqBody := map[string]interface{}{
-		"model":      model,
-		"max_tokens": 1000,
-		"system":     system,
-		"messages": []map[string]string{
-			{"role": "user", "content": query},
+	reqBody := &anthropicRequest{
+		Model:     model,
+		MaxTokens: 1000,
+		System:    system,
+		Messages: []chatMessage{
+			{Role: "user", Content: query},
 		},
 	}
 
@@ -489,13 +839,12 @@ func (r *Router) callAnthropic(ctx context.Context, system, query, model, apiKey
 
 // callOllama calls the local Ollama API
 func (r *Router) callOllama(ctx context.Context, system, query, model string) (string, error) {
-	reqBody := map[string]interface{}{
-		"model": model,
-		"messages": []map[string]string{
-			{"role": "system", "content": system},
-			{"role": "user", "content": query},
+	reqBody := &chatRequest{
+		Model: model,
+		Messages: []chatMessage{
+			{Role: "system", Content: system},
+			{Role: "user", Content: query},
 		},
-		"stream": false,
 	}
 
 	url := fmt.Sprintf("%s/api/chat", r.config.OllamaURL)
@@ -505,12 +854,17 @@ func (r *Router) callOllama(ctx context.Context, system, query, model string) (s
 }
 
 // makeRequest makes an HTTP request to an LLM API
-func (r *Router) makeRequest(ctx context.Context, url string, body map[string]interface{}, headers map[string]string) (string, error) {
+func (r *Router) makeRequest(ctx context.Context, url string, body interface{}, headers map[string]string) (string, error) {
 	jsonBody, err := jsonx.Marshal(body)
 	if err != nil {
 		return "", fmt.Errorf("failed to marshal request: %w", err)
 	}
 
+	return r.makeRequestBytes(ctx, url, jsonBody, headers)
+}
+
+// makeRequestBytes makes an HTTP request with a pre-serialized JSON body
+func (r *Router) makeRequestBytes(ctx context.Context, url string, jsonBody []byte, headers map[string]string) (string, error) {
 	req, err := http.NewRequestWithContext(ctx, "POST", url, bytes.NewReader(jsonBody))
 	if err != nil {
 		return "", fmt.Errorf("failed to create request: %w", err)
@@ -532,7 +886,7 @@ func (r *Router) makeRequest(ctx context.Context, url string, body map[string]in
 	}
 
 	if resp.StatusCode != http.StatusOK {
-		return "", fmt.Errorf("API error (status %d): %s", resp.StatusCode, string(respBody))
+		return "", &apiError{status: resp.StatusCode, body: string(respBody)}
 	}
 
 	var result map[string]interface{}
@@ -609,6 +963,20 @@ func parseJSONFromResponse(response string) (map[string]interface{}, error) {
 
 	textToParse := response[startIdx:]
 
+	// Fast path: a single balanced-bracket walk yields exactly one
+	// candidate, avoiding the quadratic scan over every closer below
+	if end := findBalanced(textToParse); end >= 0 {
+		var result interface{}
+		if err := jsonx.UnmarshalFromString(textToParse[:end+1], &result); err == nil {
+			switch v := result.(type) {
+			case map[string]interface{}:
+				return v, nil
+			case []interface{}:
+				return map[string]interface{}{"items": v}, nil
+			}
+		}
+	}
+
 	// Try to find valid JSON by trying different end points
 	closer := byte('}') // Default to object closer
 	if response[startIdx] == '[' {
@@ -621,7 +989,7 @@ func parseJSONFromResponse(response string) (map[string]interface{}, error) {
 		if textToParse[i] == closer {
 			candidate := textToParse[:i+1]
 			var result interface{}
-			if err := jsonx.Unmarshal([]byte(candidate), &result); err == nil {
+			if err := jsonx.UnmarshalFromString(candidate, &result); err == nil {
 				// Successfully parsed
 				switch v := result.(type) {
 				case map[string]interface{}:
@@ -647,6 +1015,48 @@ func parseJSONFromResponse(response string) (map[string]interface{}, error) {
 	return make(map[string]interface{}), nil
 }
 
+// findBalanced returns the index of the bracket matching s[0] ('{' or '['),
+// skipping brackets inside JSON strings, or -1 if the text is unbalanced
+func findBalanced(s string) int {
+	if len(s) == 0 || (s[0] != '{' && s[0] != '[') {
+		return -1
+	}
+
+	depth := 0
+	inString := false
+	escaped := false
+
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+
+		if inString {
+			switch {
+			case escaped:
+				escaped = false
+			case c == '\\':
+				escaped = true
+			case c == '"':
+				inString = false
+			}
+			continue
+		}
+
+		switch c {
+		case '"':
+			inString = true
+		case '{', '[':
+			depth++
+		case '}', ']':
+			depth--
+			if depth == 0 {
+				return i
+			}
+		}
+	}
+
+	return -1
+}
+
 // GetProviders returns the list of available providers
 func (r *Router) GetProviders() []Provider {
 	r.mu.RLock()
@@ -18,6 +18,64 @@ const (
 	MaxPromptInputLength = 5000
 )
 
+// Prompt templates live at package level so the static text (and its
+// token cost) is maintained in one place; per-call work is only the
+// Sprintf substitution.
+const (
+	synthesisPromptTmpl = `You are a memory retrieval system. Your ONLY job is to answer questions using the KNOWN FACTS below.
+
+CRITICAL RULES:
+1. If facts are provided, you MUST use them to answer
+2. NEVER say "I don't have information" if facts are available
+3. Quote the facts directly in your answer
+4. If no facts match the query, say "I don't have that stored yet"
+
+Query: %s
+
+=== KNOWN FACTS (USE THESE!) ===
+%s
+
+=== INSIGHTS ===
+%s
+
+=== ALERTS ===
+%s
+
+EXAMPLE:
+- If facts say "Bob: user's manager" and query is "Who is my manager?"
+- Your answer MUST be: "Your manager is Bob."
+
+Now answer the query using the facts above.
+
+Return JSON:
+{"brief": "your answer using the facts", "confidence": 0.0-1.0}`
+
+	connectionPromptTmpl = `Analyze if these two pieces of information have a meaningful, non-obvious connection.
+
+Item 1: %s (%s)
+Description: %s
+
+Item 2: %s (%s)
+Description: %s
+
+Already connected: %t (path length: %d)
+
+Look for:
+1. Potential conflicts (allergies vs food preferences)
+2. Hidden dependencies
+3. Causal relationships
+4. Temporal patterns
+
+Return JSON:
+{
+  "has_insight": true/false,
+  "insight_type": "warning|opportunity|dependency|pattern",
+  "summary": "brief description of the insight",
+  "action_suggestion": "what to do about it",
+  "confidence": 0.0-1.0
+}`
+)
+
 var (
 	// chitchatPatterns contains patterns for messages that don't need extraction
 	chitchatPatterns = []*regexp.Regexp{
@@ -306,61 +364,12 @@ func (s *SynthesisSLM) formatAlerts(alerts []string) string {
 }
 
 func (s *SynthesisSLM) buildSynthesisPrompt(query, factsText, insightsText, alertsText string) string {
-	return fmt.Sprintf(`You are a memory retrieval system. Your ONLY job is to answer questions using the KNOWN FACTS below.
-
-CRITICAL RULES:
-1. If facts are provided, you MUST use them to answer
-2. NEVER say "I don't have information" if facts are available
-3. Quote the facts directly in your answer
-4. If no facts match the query, say "I don't have that stored yet"
-
-Query: %s
-
-=== KNOWN FACTS (USE THESE!) ===
-%s
-
-=== INSIGHTS ===
-%s
-
-=== ALERTS ===
-%s
-
-EXAMPLE:
-- If facts say "Bob: user's manager" and query is "Who is my manager?"
-- Your answer MUST be: "Your manager is Bob."
-
-Now answer the query using the facts above.
-
-Return JSON:
-{"brief": "your answer using the facts", "confidence": 0.0-1.0}`, query, factsText, insightsText, alertsText)
+	return fmt.Sprintf(synthesisPromptTmpl, query, factsText, insightsText, alertsText)
 }
 
 // EvaluateConnection evaluates if two nodes have an emergent insight
 func (s *SynthesisSLM) EvaluateConnection(ctx context.Context, node1, node2 map[string]interface{}, pathExists bool, pathLength int) (*InsightResult, error) {
-	prompt := fmt.Sprintf(`Analyze if these two pieces of information have a meaningful, non-obvious connection.
-
-Item 1: %s (%s)
-Description: %s
-
-Item 2: %s (%s)
-Description: %s
-
-Already connected: %t (path length: %d)
-
-Look for:
-1. Potential conflicts (allergies vs food preferences)
-2. Hidden dependencies
-3. Causal relationships
-4. Temporal patterns
-
-Return JSON:
-{
-  "has_insight": true/false,
-  "insight_type": "warning|opportunity|dependency|pattern",
-  "summary": "brief description of the insight",
-  "action_suggestion": "what to do about it",
-  "confidence": 0.0-1.0
-}`,
+	prompt := fmt.Sprintf(connectionPromptTmpl,
 		getString(node1, "name"),
 		getString(node1, "type"),
 		getString(node1, "description"),
@@ -4,7 +4,9 @@ package synthesis
 import (
 	"context"
 	"fmt"
+	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/reflective-memory-kernel/internal/ai/router"
@@ -67,30 +69,11 @@ type ConnectionEvaluation struct {
 	Confidence       float64 `json:"confidence"`
 }
 
-// New creates a new synthesis service
-func New(r *router.Router, logger *zap.Logger) *Service {
-	if logger == nil {
-		logger = zap.NewNop()
-	}
-
-	return &Service{
-		router:  r,
-		logger:  logger,
-		provider: router.ProviderNVIDIA,
-		model:    "moonshotai/kimi-k2-instruct-0905",
-	}
-}
-
-// Synthesize creates a coherent brief from facts and insights
-func (s *Service) Synthesize(ctx context.Context, req *SynthesisRequest) (*SynthesisResponse, error) {
-	start := time.Now()
-
-	// Format facts
-	factsText := s.formatFacts(req.Facts, 10)
-	insightsText := s.formatInsights(req.Insights, 5)
-	alertsText := s.formatAlerts(req.Alerts, 3)
-
-	prompt := fmt.Sprintf(`You are a memory retrieval system. Your ONLY job is to answer questions using the KNOWN FACTS below.
+// Prompt templates are package-level constants so the static text is
+// written (and token-budgeted) in exactly one place; per-call work is
+// just the Sprintf substitution.
+const (
+	synthesisPromptTmpl = `You are a memory retrieval system. Your ONLY job is to answer questions using the KNOWN FACTS below.
 
 CRITICAL RULES:
 1. If facts are provided, you MUST use them to answer
@@ -115,7 +98,58 @@ EXAMPLE:
 
 Now answer the query using the facts above.
 
-Return JSON: {"brief": "your answer using the facts", "confidence": 0.0-1.0}`,
+Return JSON: {"brief": "your answer using the facts", "confidence": 0.0-1.0}`
+
+	connectionPromptTmpl = `Analyze if these two pieces of information have a meaningful, non-obvious connection.
+
+Item 1: %s (%s)
+Description: %s
+
+Item 2: %s (%s)
+Description: %s
+
+Already connected: %t (path length: %d)
+
+Look for:
+1. Potential conflicts (allergies vs food preferences)
+2. Hidden dependencies
+3. Causal relationships
+4. Temporal patterns
+
+Return JSON:
+{
+  "has_insight": true/false,
+  "insight_type": "warning|opportunity|dependency|pattern",
+  "summary": "brief description of the insight",
+  "action_suggestion": "what to do about it",
+  "confidence": 0.0-1.0
+}`
+)
+
+// New creates a new synthesis service
+func New(r *router.Router, logger *zap.Logger) *Service {
+	if logger == nil {
+		logger = zap.NewNop()
+	}
+
+	return &Service{
+		router:  r,
+		logger:  logger,
+		provider: router.ProviderNVIDIA,
+		model:    "moonshotai/kimi-k2-instruct-0905",
+	}
+}
+
+// Synthesize creates a coherent brief from facts and insights
+func (s *Service) Synthesize(ctx context.Context, req *SynthesisRequest) (*SynthesisResponse, error) {
+	start := time.Now()
+
+	// Format facts
+	factsText := s.formatFacts(req.Facts, 10)
+	insightsText := s.formatInsights(req.Insights, 5)
+	alertsText := s.formatAlerts(req.Alerts, 3)
+
+	prompt := fmt.Sprintf(synthesisPromptTmpl,
 		req.Query,
 		factsText,
 		insightsText,
@@ -163,30 +197,7 @@ func (s *Service) EvaluateConnection(ctx context.Context, node1, node2 map[strin
 	typ2 := getString(node2, "type")
 	desc2 := getString(node2, "description")
 
-	prompt := fmt.Sprintf(`Analyze if these two pieces of information have a meaningful, non-obvious connection.
-
-Item 1: %s (%s)
-Description: %s
-
-Item 2: %s (%s)
-Description: %s
-
-Already connected: %t (path length: %d)
-
-Look for:
-1. Potential conflicts (allergies vs food preferences)
-2. Hidden dependencies
-3. Causal relationships
-4. Temporal patterns
-
-Return JSON:
-{
-  "has_insight": true/false,
-  "insight_type": "warning|opportunity|dependency|pattern",
-  "summary": "brief description of the insight",
-  "action_suggestion": "what to do about it",
-  "confidence": 0.0-1.0
-}`,
+	prompt := fmt.Sprintf(connectionPromptTmpl,
 		name1, typ1, orDefault(desc1, "No description"),
 		name2, typ2, orDefault(desc2, "No description"),
 		pathExists, pathLength,
@@ -215,19 +226,59 @@ Return JSON:
 	return eval, nil
 }
 
-// formatFacts formats facts into a string
+// ConnectionPair is one candidate node pair queued for insight evaluation
+type ConnectionPair struct {
+	Node1      map[string]interface{}
+	Node2      map[string]interface{}
+	PathExists bool
+	PathLength int
+}
+
+// defaultEvaluateConcurrency bounds how many connection evaluations are
+// in flight at the LLM at once when the caller passes no limit
+const defaultEvaluateConcurrency = 16
+
+// EvaluateConnections evaluates many node pairs concurrently, bounded by
+// the given concurrency (defaultEvaluateConcurrency when <= 0). Each
+// evaluation is independent LLM latency, so running them in parallel
+// collapses pair_count serial round trips into roughly
+// pair_count/concurrency. Results are returned in pair order; pairs whose
+// evaluation failed get the same no-insight result EvaluateConnection
+// falls back to.
+func (s *Service) EvaluateConnections(ctx context.Context, pairs []ConnectionPair, concurrency int) []*ConnectionEvaluation {
+	if concurrency <= 0 {
+		concurrency = defaultEvaluateConcurrency
+	}
+
+	results := make([]*ConnectionEvaluation, len(pairs))
+	sem := make(chan struct{}, concurrency)
+	var wg sync.WaitGroup
+	for i, pair := range pairs {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int, pair ConnectionPair) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			results[i], _ = s.EvaluateConnection(ctx, pair.Node1, pair.Node2, pair.PathExists, pair.PathLength)
+		}(i, pair)
+	}
+	wg.Wait()
+	return results
+}
+
+// formatFacts formats the max highest-weight facts into a string.
+// Ranking happens before any string building, so formatting work stays
+// O(max) and the prompt carries the most important facts rather than
+// whichever ones happened to come first.
 func (s *Service) formatFacts(facts []Fact, max int) string {
 	if len(facts) == 0 {
 		return "No facts stored."
 	}
 
-	limit := len(facts)
-	if max > 0 && limit > max {
-		limit = max
-	}
-
 	var builder strings.Builder
-	for i := 0; i < limit; i++ {
+	for _, i := range topIndices(len(facts), max, func(a, b int) bool {
+		return facts[a].Weight > facts[b].Weight
+	}) {
 		builder.WriteString(s.formatFact(facts[i]))
 		builder.WriteString("\n")
 	}
@@ -235,6 +286,41 @@ func (s *Service) formatFacts(facts []Fact, max int) string {
 	return builder.String()
 }
 
+// topIndices returns the indices of the top max elements under the given
+// ordering, in their original positions, preserving input order among
+// equals so unranked items keep their retrieval order
+func topIndices(n, max int, less func(a, b int) bool) []int {
+	if max <= 0 || max >= n {
+		// Everything qualifies; original positions are just 0..n-1
+		order := make([]int, n)
+		for i := range order {
+			order[i] = i
+		}
+		return order
+	}
+
+	// Repeated selection finds the max best without ordering the rest:
+	// O(n*max) with a small max beats the full stable sort. Replacing
+	// only on strict improvement keeps input order among equals.
+	taken := make([]bool, n)
+	order := make([]int, 0, max)
+	for len(order) < max {
+		best := -1
+		for i := 0; i < n; i++ {
+			if taken[i] {
+				continue
+			}
+			if best < 0 || less(i, best) {
+				best = i
+			}
+		}
+		taken[best] = true
+		order = append(order, best)
+	}
+	sort.Ints(order)
+	return order
+}
+
 // formatFact formats a single fact
 func (s *Service) formatFact(f Fact) string {
 	var builder strings.Builder
@@ -278,13 +364,10 @@ func (s *Service) formatInsights(insights []Insight, max int) string {
 		return "None."
 	}
 
-	limit := len(insights)
-	if max > 0 && limit > max {
-		limit = max
-	}
-
 	var builder strings.Builder
-	for i := 0; i < limit; i++ {
+	for _, i := range topIndices(len(insights), max, func(a, b int) bool {
+		return insights[a].Confidence > insights[b].Confidence
+	}) {
 		builder.WriteString("- ")
 		builder.WriteString(insights[i].Summary)
 		builder.WriteString("\n")
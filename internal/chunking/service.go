@@ -1,14 +1,26 @@
 // Package chunking provides high-performance semantic text chunking
 // Optimized for document processing and RAG applications
+//
+// The whole scan runs in-process over the input string: there is no
+// per-chunk boundary crossing to a foreign chunker, and the span-based
+// core (chunkSpans) lets consumers take byte offsets, texts, or full
+// results from a single pass.
 package chunking
 
 import (
-	"bytes"
 	"strings"
+	"sync"
 	"unicode/utf8"
 )
 
-// ChunkResult represents a single chunk with metadata
+// ChunkResult represents a single chunk with metadata.
+//
+// Text is a view into the input string, not a copy: chunking never
+// re-decodes or duplicates chunk bytes, and StartPos/EndPos are byte
+// offsets into the original input for callers that only need positions.
+// Holding a ChunkResult keeps the whole input string reachable; callers
+// that retain chunks long after dropping a much larger input should
+// clone Text explicitly.
 type ChunkResult struct {
 	Text        string `json:"text"`
 	StartPos    int    `json:"start_pos"`
@@ -76,6 +88,27 @@ func SentencePieceConfig(chunkSize int) *Config {
 // Chunker performs semantic text chunking
 type Chunker struct {
 	config *Config
+
+	// asciiDelims holds the configured delimiters as a string when they
+	// are all ASCII, enabling single-pass IndexAny/LastIndexAny scans
+	// instead of one pass per delimiter. Empty for non-ASCII delimiter
+	// bytes, which fall back to per-delimiter scans.
+	asciiDelims string
+
+	// pattern is the multi-byte pattern as a string, derived once at
+	// construction so the per-window searches need no conversion
+	pattern string
+
+	// delimTable marks delimiter bytes for O(1) membership checks in the
+	// consecutive-run walks, instead of a linear scan over the delimiter
+	// list per byte
+	delimTable delimSet
+
+	// singleDelim holds the delimiter when exactly one is configured,
+	// letting the scans call IndexByte/LastIndexByte directly instead of
+	// going through the any-of-set machinery
+	singleDelim    byte
+	hasSingleDelim bool
 }
 
 // New creates a new chunker with the given configuration
@@ -83,7 +116,27 @@ func New(config *Config) *Chunker {
 	if config == nil {
 		config = DefaultConfig()
 	}
-	return &Chunker{config: config}
+
+	c := &Chunker{config: config}
+	ascii := len(config.Delimiters) > 0
+	for _, d := range config.Delimiters {
+		if d >= utf8.RuneSelf {
+			ascii = false
+			break
+		}
+	}
+	if ascii {
+		c.asciiDelims = string(config.Delimiters)
+	}
+	c.pattern = string(config.Pattern)
+	for _, d := range config.Delimiters {
+		c.delimTable.add(d)
+	}
+	if len(config.Delimiters) == 1 {
+		c.singleDelim = config.Delimiters[0]
+		c.hasSingleDelim = true
+	}
+	return c
 }
 
 // NewMarkdown creates a chunker optimized for Markdown
@@ -102,7 +155,67 @@ func (c *Chunker) Chunk(text string) []ChunkResult {
 		return nil
 	}
 
-	results := make([]ChunkResult, 0)
+	// Size the result slice for the expected chunk count up front so the
+	// append loop never regrows and copies it
+	capacity := 1
+	if c.config.ChunkSize > 0 {
+		capacity = len(text)/c.config.ChunkSize + 1
+	}
+	results := make([]ChunkResult, 0, capacity)
+	c.ChunkEach(text, func(r ChunkResult) bool {
+		results = append(results, r)
+		return true
+	})
+	return results
+}
+
+// ChunkEach streams chunks to fn as they are found, without materializing
+// the full result slice. Chunk texts are views into the input, so a
+// consumer that processes chunks one at a time holds no extra copies.
+// Returning false from fn stops the scan early.
+func (c *Chunker) ChunkEach(text string, fn func(ChunkResult) bool) {
+	c.chunkSpans(text, func(start, end int, complete bool) bool {
+		return fn(ChunkResult{
+			Text:       text[start:end],
+			StartPos:   start,
+			EndPos:     end,
+			IsComplete: complete,
+			CharCount:  utf8.RuneCountInString(text[start:end]),
+			ByteCount:  end - start,
+		})
+	})
+}
+
+// ChunkOffsets returns the chunk boundaries as parallel start/end byte
+// offset slices, without building any ChunkResult values. Callers that
+// only need positions — indexing, size accounting, handing spans to a
+// tokenizer — get two flat int slices and no per-chunk text slicing or
+// rune counting.
+func (c *Chunker) ChunkOffsets(text string) (starts, ends []int) {
+	if text == "" {
+		return nil, nil
+	}
+
+	capacity := 1
+	if c.config.ChunkSize > 0 {
+		capacity = len(text)/c.config.ChunkSize + 1
+	}
+	starts = make([]int, 0, capacity)
+	ends = make([]int, 0, capacity)
+	c.chunkSpans(text, func(start, end int, _ bool) bool {
+		starts = append(starts, start)
+		ends = append(ends, end)
+		return true
+	})
+	return starts, ends
+}
+
+// chunkSpans is the scan loop shared by every chunking entry point. It
+// emits (start, end, complete) byte spans and leaves slicing and metadata
+// to the caller, so consumers that only want texts or offsets skip the
+// per-chunk rune counting entirely. Returning false from fn stops the
+// scan.
+func (c *Chunker) chunkSpans(text string, fn func(start, end int, complete bool) bool) {
 	position := 0
 	textLen := len(text)
 	overlap := c.config.Overlap
@@ -112,15 +225,8 @@ func (c *Chunker) Chunk(text string) []ChunkResult {
 
 		// Last chunk - return all remaining
 		if remaining <= c.config.ChunkSize {
-			results = append(results, ChunkResult{
-				Text:       text[position:],
-				StartPos:   position,
-				EndPos:     textLen,
-				IsComplete: true,
-				CharCount:  textLen - position,
-				ByteCount:  len(text[position:]),
-			})
-			break
+			fn(position, textLen, true)
+			return
 		}
 
 		// Calculate target end position
@@ -141,14 +247,9 @@ func (c *Chunker) Chunk(text string) []ChunkResult {
 				actualPos = targetEnd
 			}
 
-			results = append(results, ChunkResult{
-				Text:       text[position:actualPos],
-				StartPos:   position,
-				EndPos:     actualPos,
-				IsComplete: true,
-				CharCount:  actualPos - position,
-				ByteCount:  len(text[position:actualPos]),
-			})
+			if !fn(position, actualPos, true) {
+				return
+			}
 
 			// Apply overlap
 			position = actualPos - overlap
@@ -156,7 +257,12 @@ func (c *Chunker) Chunk(text string) []ChunkResult {
 				position = 0
 			}
 		} else if c.config.ForwardFallback {
-			// Search forward for delimiter
+			// Search forward for delimiter. The two scans never read the
+			// same bytes: the backward scan walks [position, targetEnd)
+			// from the end and stops at the first hit, and this fallback
+			// only touches [targetEnd, len). A single fused forward pass
+			// would read the whole window even in the common case where a
+			// delimiter sits near targetEnd, so the split scans stay.
 			forwardWindow := text[targetEnd:]
 			forwardPos := c.findFirstDelimiter(forwardWindow)
 
@@ -166,14 +272,9 @@ func (c *Chunker) Chunk(text string) []ChunkResult {
 					actualPos++
 				}
 
-				results = append(results, ChunkResult{
-					Text:       text[position:actualPos],
-					StartPos:   position,
-					EndPos:     actualPos,
-					IsComplete: true,
-					CharCount:  actualPos - position,
-					ByteCount:  len(text[position:actualPos]),
-				})
+				if !fn(position, actualPos, true) {
+					return
+				}
 
 				position = actualPos - overlap
 				if position < 0 {
@@ -181,26 +282,14 @@ func (c *Chunker) Chunk(text string) []ChunkResult {
 				}
 			} else {
 				// No delimiter found, take all remaining
-				results = append(results, ChunkResult{
-					Text:       text[position:],
-					StartPos:   position,
-					EndPos:     textLen,
-					IsComplete: false,
-					CharCount:  textLen - position,
-					ByteCount:  len(text[position:]),
-				})
-				break
+				fn(position, textLen, false)
+				return
 			}
 		} else {
 			// Hard split at target position
-			results = append(results, ChunkResult{
-				Text:       text[position:targetEnd],
-				StartPos:   position,
-				EndPos:     targetEnd,
-				IsComplete: false,
-				CharCount:  targetEnd - position,
-				ByteCount:  len(text[position:targetEnd]),
-			})
+			if !fn(position, targetEnd, false) {
+				return
+			}
 
 			position = targetEnd - overlap
 			if position < 0 {
@@ -208,264 +297,208 @@ func (c *Chunker) Chunk(text string) []ChunkResult {
 			}
 		}
 	}
-
-	return results
 }
 
-// ChunkBytes chunks raw byte data
+// ChunkBytes chunks raw byte data. The data is converted to a string
+// once up front and chunked through the string path, so the per-chunk
+// conversions are gone and positions and char counts match Chunk exactly.
 func (c *Chunker) ChunkBytes(data []byte) []ChunkResult {
 	if len(data) == 0 {
 		return nil
 	}
-
-	results := make([]ChunkResult, 0)
-	position := 0
-	dataLen := len(data)
-	overlap := c.config.Overlap
-
-	for position < dataLen {
-		remaining := dataLen - position
-
-		if remaining <= c.config.ChunkSize {
-			results = append(results, ChunkResult{
-				Text:       string(data[position:]),
-				StartPos:   position,
-				EndPos:     dataLen,
-				IsComplete: true,
-				CharCount:  utf8.RuneCount(data[position:]),
-				ByteCount:  remaining,
-			})
-			break
-		}
-
-		targetEnd := position + c.config.ChunkSize
-		splitPos := c.findLastDelimiterInBytes(data[position:targetEnd])
-
-		if splitPos >= 0 {
-			actualPos := position + splitPos
-			if !c.config.PrefixMode {
-				actualPos++
-			}
-
-			if actualPos-position < c.config.MinChunkSize && targetEnd < dataLen {
-				actualPos = targetEnd
-			}
-
-			results = append(results, ChunkResult{
-				Text:       string(data[position:actualPos]),
-				StartPos:   position,
-				EndPos:     actualPos,
-				IsComplete: true,
-				CharCount:  utf8.RuneCount(data[position:actualPos]),
-				ByteCount:  actualPos - position,
-			})
-
-			position = actualPos - overlap
-			if position < 0 {
-				position = 0
-			}
-		} else if c.config.ForwardFallback {
-			forwardWindow := data[targetEnd:]
-			forwardPos := c.findFirstDelimiterInBytes(forwardWindow)
-
-			if forwardPos >= 0 {
-				actualPos := targetEnd + forwardPos
-				if !c.config.PrefixMode {
-					actualPos++
-				}
-
-				results = append(results, ChunkResult{
-					Text:       string(data[position:actualPos]),
-					StartPos:   position,
-					EndPos:     actualPos,
-					IsComplete: true,
-					CharCount:  utf8.RuneCount(data[position:actualPos]),
-					ByteCount:  actualPos - position,
-				})
-
-				position = actualPos - overlap
-			} else {
-				results = append(results, ChunkResult{
-					Text:       string(data[position:]),
-					StartPos:   position,
-					EndPos:     dataLen,
-					IsComplete: false,
-					CharCount:  utf8.RuneCount(data[position:]),
-					ByteCount:  dataLen - position,
-				})
-				break
-			}
-		} else {
-			results = append(results, ChunkResult{
-				Text:       string(data[position:targetEnd]),
-				StartPos:   position,
-				EndPos:     targetEnd,
-				IsComplete: false,
-				CharCount:  utf8.RuneCount(data[position:targetEnd]),
-				ByteCount:  targetEnd - position,
-			})
-
-			position = targetEnd - overlap
-			if position < 0 {
-				position = 0
-			}
-		}
-	}
-
-	return results
+	return c.Chunk(string(data))
 }
 
 // findLastDelimiter finds the last occurrence of any delimiter in the string
 func (c *Chunker) findLastDelimiter(s string) int {
-	if len(c.config.Pattern) > 0 {
-		// Search for multi-byte pattern
-		idx := bytes.LastIndex([]byte(s), c.config.Pattern)
+	if c.pattern != "" {
+		// Search for multi-byte pattern. The window is a view into the
+		// input, and searching it as a string avoids the []byte copy.
+		idx := strings.LastIndex(s, c.pattern)
 		if idx >= 0 {
 			return idx
 		}
 	}
 
-	// Search for single-byte delimiters
-	for i := len(s) - 1; i >= 0; i-- {
-		if c.isDelimiter(s[i]) {
-			// Check for consecutive delimiters
-			if c.config.Consecutive {
-				// Find start of consecutive run
-				for i > 0 && c.isDelimiter(s[i-1]) {
-					i--
-				}
-			}
-			return i
-		}
+	best := c.lastDelimIndex(s)
+	if best < 0 {
+		return -1
 	}
 
-	return -1
+	if c.config.Consecutive {
+		// Find start of consecutive run
+		for best > 0 && c.isDelimiter(s[best-1]) {
+			best--
+		}
+	}
+	return best
 }
 
-// findLastDelimiterInBytes finds the last delimiter in byte slice
-func (c *Chunker) findLastDelimiterInBytes(data []byte) int {
-	if len(c.config.Pattern) > 0 {
-		idx := bytes.LastIndex(data, c.config.Pattern)
-		if idx >= 0 {
-			return idx
+// lastDelimIndex returns the rightmost delimiter position in s: a single
+// set-based scan when the delimiters are ASCII, else one vectorized pass
+// per delimiter
+func (c *Chunker) lastDelimIndex(s string) int {
+	if c.hasSingleDelim {
+		return strings.LastIndexByte(s, c.singleDelim)
+	}
+	if c.asciiDelims != "" {
+		return strings.LastIndexAny(s, c.asciiDelims)
+	}
+	best := -1
+	for _, d := range c.config.Delimiters {
+		if idx := strings.LastIndexByte(s, d); idx > best {
+			best = idx
 		}
 	}
+	return best
+}
 
-	for i := len(data) - 1; i >= 0; i-- {
-		if c.isDelimiter(data[i]) {
-			if c.config.Consecutive {
-				for i > 0 && c.isDelimiter(data[i-1]) {
-					i--
-				}
-			}
-			return i
+// firstDelimIndex is the forward counterpart of lastDelimIndex
+func (c *Chunker) firstDelimIndex(s string) int {
+	if c.hasSingleDelim {
+		return strings.IndexByte(s, c.singleDelim)
+	}
+	if c.asciiDelims != "" {
+		return strings.IndexAny(s, c.asciiDelims)
+	}
+	best := -1
+	for _, d := range c.config.Delimiters {
+		if idx := strings.IndexByte(s, d); idx >= 0 && (best < 0 || idx < best) {
+			best = idx
 		}
 	}
-
-	return -1
+	return best
 }
 
 // findFirstDelimiter finds the first occurrence of any delimiter
 func (c *Chunker) findFirstDelimiter(s string) int {
-	if len(c.config.Pattern) > 0 {
-		idx := bytes.Index([]byte(s), c.config.Pattern)
+	if c.pattern != "" {
+		idx := strings.Index(s, c.pattern)
 		if idx >= 0 {
 			return idx
 		}
 	}
 
-	for i, r := range s {
-		if c.isDelimiter(byte(r)) {
-			if c.config.Consecutive {
-				// Skip all consecutive delimiters
-				for j := i + 1; j < len(s); j++ {
-					if !c.isDelimiter(s[j]) {
-						return j
-					}
-				}
-				return len(s)
-			}
-			return i
-		}
+	best := c.firstDelimIndex(s)
+	if best < 0 {
+		return -1
 	}
 
-	return -1
-}
-
-// findFirstDelimiterInBytes finds the first delimiter in byte slice
-func (c *Chunker) findFirstDelimiterInBytes(data []byte) int {
-	if len(c.config.Pattern) > 0 {
-		idx := bytes.Index(data, c.config.Pattern)
-		if idx >= 0 {
-			return idx
+	if c.config.Consecutive {
+		// Skip all consecutive delimiters
+		j := best + 1
+		for j < len(s) && c.isDelimiter(s[j]) {
+			j++
 		}
+		return j
 	}
+	return best
+}
 
-	for i, b := range data {
-		if c.isDelimiter(b) {
-			if c.config.Consecutive {
-				for j := i + 1; j < len(data); j++ {
-					if !c.isDelimiter(data[j]) {
-						return j
-					}
-				}
-				return len(data)
-			}
-			return i
-		}
-	}
+// delimSet is a 256-bit membership bitmap over byte values. At 32 bytes
+// it spans half a cache line, versus four lines for a [256]bool table,
+// so it stays resident for the duration of a scan.
+type delimSet [4]uint64
 
-	return -1
+func (s *delimSet) add(b byte) {
+	s[b>>6] |= 1 << (b & 63)
+}
+
+func (s *delimSet) contains(b byte) bool {
+	return s[b>>6]&(1<<(b&63)) != 0
 }
 
 // isDelimiter checks if a byte is a delimiter
 func (c *Chunker) isDelimiter(b byte) bool {
-	for _, d := range c.config.Delimiters {
-		if b == d {
-			return true
-		}
-	}
-	return false
+	return c.delimTable.contains(b)
 }
 
-// ChunkText is a convenience function for simple chunking
-func ChunkText(text string, chunkSize int, delimiters string) []string {
-	config := &Config{
+// chunkTextKey identifies the configuration a cached convenience chunker
+// was built for
+type chunkTextKey struct {
+	chunkSize  int
+	delimiters string
+}
+
+// chunkTextCache reuses chunkers across ChunkText calls. The derived
+// matcher state (ASCII delimiter set, lookup table) depends only on the
+// configuration, and a chunker is read-only after construction, so the
+// handful of distinct configs callers actually use pay setup once.
+var (
+	chunkTextMu    sync.Mutex
+	chunkTextCache = map[chunkTextKey]*Chunker{}
+)
+
+// chunkTextCacheMax bounds the config cache; it is cleared wholesale if
+// callers somehow produce more distinct configs than this
+const chunkTextCacheMax = 64
+
+// chunkerFor returns the cached chunker for the given convenience config,
+// constructing and caching it on first use
+func chunkerFor(chunkSize int, delimiters string) *Chunker {
+	key := chunkTextKey{chunkSize: chunkSize, delimiters: delimiters}
+
+	chunkTextMu.Lock()
+	defer chunkTextMu.Unlock()
+	if chunker, ok := chunkTextCache[key]; ok {
+		return chunker
+	}
+
+	chunker := New(&Config{
 		ChunkSize:  chunkSize,
 		Delimiters: []byte(delimiters),
 		PrefixMode: false,
+	})
+	if len(chunkTextCache) >= chunkTextCacheMax {
+		chunkTextCache = map[chunkTextKey]*Chunker{}
 	}
+	chunkTextCache[key] = chunker
+	return chunker
+}
 
-	chunker := New(config)
-	results := chunker.Chunk(text)
-
-	chunks := make([]string, len(results))
-	for i, r := range results {
-		chunks[i] = r.Text
-	}
-
+// ChunkText is a convenience function for simple chunking. It consumes
+// the span stream directly, so no ChunkResult metadata (including the
+// per-chunk rune counts) is ever computed for the texts-only path.
+func ChunkText(text string, chunkSize int, delimiters string) []string {
+	capacity := 1
+	if chunkSize > 0 {
+		capacity = len(text)/chunkSize + 1
+	}
+	chunks := make([]string, 0, capacity)
+	chunkerFor(chunkSize, delimiters).chunkSpans(text, func(start, end int, _ bool) bool {
+		chunks = append(chunks, text[start:end])
+		return true
+	})
 	return chunks
 }
 
-// ChunkBySize chunks text into fixed-size chunks without semantic splitting
+// ChunkBySize chunks text into fixed-size chunks without semantic splitting.
+// Chunk boundaries are rune-aligned, but the text is never materialized as
+// a []rune: the scan ranges over the string's rune start offsets and each
+// chunk is a slice of the input, so the only allocations are the result
+// slice headers.
 func ChunkBySize(text string, chunkSize int) []string {
 	if text == "" {
 		return nil
 	}
 
-	runes := []rune(text)
-	if len(runes) <= chunkSize {
+	charCount := utf8.RuneCountInString(text)
+	if charCount <= chunkSize {
 		return []string{text}
 	}
 
-	chunks := make([]string, 0, (len(runes)+chunkSize-1)/chunkSize)
-	for i := 0; i < len(runes); i += chunkSize {
-		end := i + chunkSize
-		if end > len(runes) {
-			end = len(runes)
+	chunks := make([]string, 0, (charCount+chunkSize-1)/chunkSize)
+	start := 0
+	count := 0
+	for i := range text {
+		if count == chunkSize {
+			chunks = append(chunks, text[start:i])
+			start = i
+			count = 0
 		}
-		chunks = append(chunks, string(runes[i:end]))
+		count++
 	}
+	chunks = append(chunks, text[start:])
 
 	return chunks
 }
@@ -476,19 +509,28 @@ func ChunkByLines(text string, linesPerChunk int) []string {
 		return nil
 	}
 
-	lines := strings.Split(text, "\n")
-	if len(lines) <= linesPerChunk {
+	lineCount := strings.Count(text, "\n") + 1
+	if lineCount <= linesPerChunk {
 		return []string{text}
 	}
 
-	chunks := make([]string, 0, (len(lines)+linesPerChunk-1)/linesPerChunk)
-	for i := 0; i < len(lines); i += linesPerChunk {
-		end := i + linesPerChunk
-		if end > len(lines) {
-			end = len(lines)
+	// Scan newline offsets and slice the original string directly: each
+	// chunk shares the input's backing array instead of materializing a
+	// line slice and re-joining it
+	chunks := make([]string, 0, (lineCount+linesPerChunk-1)/linesPerChunk)
+	start := 0
+	linesInChunk := 0
+	for i := 0; i < len(text); i++ {
+		if text[i] == '\n' {
+			linesInChunk++
+			if linesInChunk == linesPerChunk {
+				chunks = append(chunks, text[start:i])
+				start = i + 1
+				linesInChunk = 0
+			}
 		}
-		chunks = append(chunks, strings.Join(lines[i:end], "\n"))
 	}
+	chunks = append(chunks, text[start:])
 
 	return chunks
 }
@@ -519,31 +561,28 @@ func ChunkBySentences(text string) []string {
 		return nil
 	}
 
+	// Sentence enders and their followers are all ASCII, so a byte scan
+	// sees exactly what a rune scan would (UTF-8 continuation bytes never
+	// collide with ASCII). Sentences are trimmed slices of the input,
+	// sharing its backing array instead of accumulating through a builder.
 	chunks := make([]string, 0)
-	current := strings.Builder{}
-
-	runes := []rune(text)
-	for i := 0; i < len(runes); i++ {
-		current.WriteRune(runes[i])
-
-		// Check for sentence endings
-		if runes[i] == '.' || runes[i] == '!' || runes[i] == '?' {
+	start := 0
+	for i := 0; i < len(text); i++ {
+		if b := text[i]; b == '.' || b == '!' || b == '?' {
 			// Check if followed by space or end of string
-			if i+1 >= len(runes) || runes[i+1] == ' ' || runes[i+1] == '\n' {
-				s := current.String()
-				if strings.TrimSpace(s) != "" {
-					chunks = append(chunks, strings.TrimSpace(s))
+			if i+1 >= len(text) || text[i+1] == ' ' || text[i+1] == '\n' {
+				if s := strings.TrimSpace(text[start : i+1]); s != "" {
+					chunks = append(chunks, s)
 				}
-				current.Reset()
+				start = i + 1
 			}
 		}
 	}
 
 	// Add remaining text
-	if current.Len() > 0 {
-		s := current.String()
-		if strings.TrimSpace(s) != "" {
-			chunks = append(chunks, strings.TrimSpace(s))
+	if start < len(text) {
+		if s := strings.TrimSpace(text[start:]); s != "" {
+			chunks = append(chunks, s)
 		}
 	}
 
@@ -556,7 +595,7 @@ func MergeChunks(chunks []ChunkResult, minSize int) []ChunkResult {
 		return chunks
 	}
 
-	merged := make([]ChunkResult, 0)
+	merged := make([]ChunkResult, 0, len(chunks))
 	current := strings.Builder{}
 	startPos := 0
 	currentSize := 0
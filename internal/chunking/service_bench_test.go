@@ -0,0 +1,125 @@
+// Package chunking benchmarks for the delimiter-scan and chunking paths.
+// Delimiter search is a single set-based pass (IndexAny/LastIndexAny) over
+// each window regardless of how many delimiters are configured, so these
+// compare the default (4 delimiters), Markdown (7 delimiters), and the
+// multi-byte SentencePiece pattern path on the same inputs.
+package chunking
+
+import (
+	"strings"
+	"sync"
+	"testing"
+)
+
+// benchText builds a synthetic document of roughly n bytes with sentence
+// and paragraph structure, so the scans hit delimiters at realistic rates
+func benchText(n int) string {
+	const sentence = "The quick brown fox jumps over the lazy dog near the riverbank. "
+	var b strings.Builder
+	b.Grow(n + len(sentence))
+	for i := 0; b.Len() < n; i++ {
+		b.WriteString(sentence)
+		if i%8 == 7 {
+			b.WriteString("\n\n")
+		}
+	}
+	return b.String()
+}
+
+// benchMarkdown builds a synthetic Markdown document of roughly n bytes
+// with headers, lists, and code fences
+func benchMarkdown(n int) string {
+	const section = "# Section\n\nSome prose about the section topic here.\n\n" +
+		"- first item\n- second item\n- third item\n\n" +
+		"```\ncode block line\n```\n\n> a quote line\n\n"
+	var b strings.Builder
+	b.Grow(n + len(section))
+	for b.Len() < n {
+		b.WriteString(section)
+	}
+	return b.String()
+}
+
+// Corpora are built lazily so running the package's tests without
+// benchmarks does not pay for megabytes of synthetic text at init
+var (
+	benchSmall    = sync.OnceValue(func() string { return benchText(4 * 1024) })
+	benchLarge    = sync.OnceValue(func() string { return benchText(1024 * 1024) })
+	benchMarkdoc  = sync.OnceValue(func() string { return benchMarkdown(1024 * 1024) })
+	benchWindow   = sync.OnceValue(func() string { return benchText(8 * 1024)[:4096] })
+	benchMDWindow = sync.OnceValue(func() string { return benchMarkdown(8 * 1024)[:4096] })
+)
+
+func BenchmarkChunkDefaultSmall(b *testing.B) {
+	chunker := New(DefaultConfig())
+	b.SetBytes(int64(len(benchSmall())))
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		_ = chunker.Chunk(benchSmall())
+	}
+}
+
+func BenchmarkChunkDefaultLarge(b *testing.B) {
+	chunker := New(DefaultConfig())
+	b.SetBytes(int64(len(benchLarge())))
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		_ = chunker.Chunk(benchLarge())
+	}
+}
+
+func BenchmarkChunkMarkdownLarge(b *testing.B) {
+	chunker := NewMarkdown(1024)
+	b.SetBytes(int64(len(benchMarkdoc())))
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		_ = chunker.Chunk(benchMarkdoc())
+	}
+}
+
+func BenchmarkChunkSentencePieceLarge(b *testing.B) {
+	chunker := NewSentencePiece(1024)
+	// Rewrite word boundaries as the metaspace marker so the pattern
+	// path actually finds split points
+	text := strings.ReplaceAll(benchLarge(), " ", "▁")
+	b.SetBytes(int64(len(text)))
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		_ = chunker.Chunk(text)
+	}
+}
+
+// Window-level benchmarks isolate one backward and one forward delimiter
+// scan, which is the inner loop Chunk runs once or twice per chunk
+
+func BenchmarkFindLastDelimiterDefault(b *testing.B) {
+	chunker := New(DefaultConfig())
+	b.SetBytes(int64(len(benchWindow())))
+	for i := 0; i < b.N; i++ {
+		_ = chunker.findLastDelimiter(benchWindow())
+	}
+}
+
+func BenchmarkFindLastDelimiterMarkdown(b *testing.B) {
+	chunker := NewMarkdown(4096)
+	b.SetBytes(int64(len(benchMDWindow())))
+	for i := 0; i < b.N; i++ {
+		_ = chunker.findLastDelimiter(benchMDWindow())
+	}
+}
+
+func BenchmarkFindFirstDelimiterDefault(b *testing.B) {
+	chunker := New(DefaultConfig())
+	b.SetBytes(int64(len(benchWindow())))
+	for i := 0; i < b.N; i++ {
+		_ = chunker.findFirstDelimiter(benchWindow())
+	}
+}
+
+func BenchmarkFindFirstDelimiterMarkdown(b *testing.B) {
+	chunker := NewMarkdown(4096)
+	b.SetBytes(int64(len(benchMDWindow())))
+	for i := 0; i < b.N; i++ {
+		_ = chunker.findFirstDelimiter(benchMDWindow())
+	}
+}
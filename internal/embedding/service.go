@@ -6,6 +6,7 @@ import (
 	"bytes"
 	"encoding/json"
 	"fmt"
+	"math"
 	"net/http"
 	"sync"
 	"time"
@@ -99,28 +100,110 @@ func (s *Service) Embed(text string) ([]float32, error) {
 	return result.Embedding, nil
 }
 
-// EmbedBatch generates embeddings for multiple texts.
+// embedBatchRequest is the batched request format for the AI service.
+type embedBatchRequest struct {
+	Texts []string `json:"texts"`
+}
+
+// embedBatchResponse is the batched response format from the AI service.
+type embedBatchResponse struct {
+	Embeddings [][]float32 `json:"embeddings"`
+}
+
+// EmbedBatch generates embeddings for multiple texts in one round trip.
+// Texts already in the cache are skipped; only the misses go on the wire.
 func (s *Service) EmbedBatch(texts []string) ([][]float32, error) {
 	embeddings := make([][]float32, len(texts))
+
+	// Serve what we can from the cache
+	missing := make([]string, 0, len(texts))
+	missingIdx := make([]int, 0, len(texts))
+	s.cacheMu.RLock()
 	for i, text := range texts {
-		emb, err := s.Embed(text)
-		if err != nil {
-			return nil, err
+		if emb, ok := s.cache[text]; ok {
+			embeddings[i] = emb
+		} else {
+			missing = append(missing, text)
+			missingIdx = append(missingIdx, i)
+		}
+	}
+	s.cacheMu.RUnlock()
+
+	if len(missing) == 0 {
+		return embeddings, nil
+	}
+
+	reqBody, err := json.Marshal(embedBatchRequest{Texts: missing})
+	if err != nil {
+		return nil, err
+	}
+
+	resp, err := s.client.Post(
+		s.aiServicesURL+"/embed-batch",
+		"application/json",
+		bytes.NewBuffer(reqBody),
+	)
+	if err != nil {
+		s.logger.Warn("Embedding service unavailable, falling back to nil", zap.Error(err))
+		return embeddings, nil // Don't fail - just skip embedding
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode != http.StatusOK {
+		// Older AI service without /embed-batch: fall back to per-text calls
+		if resp.StatusCode == http.StatusNotFound {
+			for j, text := range missing {
+				emb, err := s.Embed(text)
+				if err != nil {
+					return nil, err
+				}
+				embeddings[missingIdx[j]] = emb
+			}
+			return embeddings, nil
 		}
-		embeddings[i] = emb
+		return nil, fmt.Errorf("embedding service returned %d", resp.StatusCode)
+	}
+
+	var result embedBatchResponse
+	if err := json.NewDecoder(resp.Body).Decode(&result); err != nil {
+		return nil, err
+	}
+	if len(result.Embeddings) != len(missing) {
+		return nil, fmt.Errorf("embedding service returned %d embeddings for %d texts", len(result.Embeddings), len(missing))
 	}
+
+	s.cacheMu.Lock()
+	for j, emb := range result.Embeddings {
+		embeddings[missingIdx[j]] = emb
+		s.cache[missing[j]] = emb
+	}
+	s.cacheMu.Unlock()
+
 	return embeddings, nil
 }
 
 // CosineSimilarity calculates the cosine similarity between two vectors.
+// The loop is unrolled four-wide with independent accumulators so the
+// compiler keeps them in registers and overlaps the multiplies.
 func CosineSimilarity(a, b []float32) float32 {
 	if len(a) != len(b) || len(a) == 0 {
 		return 0
 	}
 
-	var dotProduct, normA, normB float32
-	for i := range a {
-		dotProduct += a[i] * b[i]
+	var dot0, dot1, dot2, dot3 float32
+	var normA, normB float32
+	n := len(a)
+	i := 0
+	for ; i+4 <= n; i += 4 {
+		dot0 += a[i] * b[i]
+		dot1 += a[i+1] * b[i+1]
+		dot2 += a[i+2] * b[i+2]
+		dot3 += a[i+3] * b[i+3]
+		normA += a[i]*a[i] + a[i+1]*a[i+1] + a[i+2]*a[i+2] + a[i+3]*a[i+3]
+		normB += b[i]*b[i] + b[i+1]*b[i+1] + b[i+2]*b[i+2] + b[i+3]*b[i+3]
+	}
+	for ; i < n; i++ {
+		dot0 += a[i] * b[i]
 		normA += a[i] * a[i]
 		normB += b[i] * b[i]
 	}
@@ -129,19 +212,8 @@ func CosineSimilarity(a, b []float32) float32 {
 		return 0
 	}
 
-	return dotProduct / (sqrt(normA) * sqrt(normB))
-}
-
-// sqrt is a simple square root for float32.
-func sqrt(x float32) float32 {
-	if x <= 0 {
-		return 0
-	}
-	z := x / 2
-	for i := 0; i < 10; i++ {
-		z = (z + x/z) / 2
-	}
-	return z
+	dotProduct := dot0 + dot1 + dot2 + dot3
+	return dotProduct / float32(math.Sqrt(float64(normA)*float64(normB)))
 }
 
 // Close releases resources.
@@ -46,6 +46,21 @@ func DefaultClientConfig() ClientConfig {
 	}
 }
 
+// NewLocalClient connects to a locally mapped DGraph instance using the
+// default configuration. It is the shared entry point for the standalone
+// debug and verification scripts, so every script reuses the same
+// configured, pooled gRPC connection setup instead of assembling its own.
+func NewLocalClient(ctx context.Context, address string, logger *zap.Logger) (*Client, error) {
+	cfg := DefaultClientConfig()
+	if address != "" {
+		cfg.Address = address
+	}
+	if logger == nil {
+		logger, _ = zap.NewDevelopment()
+	}
+	return NewClient(ctx, cfg, logger)
+}
+
 // quoteString properly escapes a string for N-Quads format (RFC4180-like quoting)
 // It wraps the string in double quotes and escapes special characters
 func quoteString(s string) string {
@@ -1567,22 +1582,23 @@ func (c *Client) ListUserGroups(ctx context.Context, userID string) ([]Group, er
 	return result.Groups, nil
 }
 
-// IsGroupAdmin checks if a user is an admin of the group
+// IsGroupAdmin checks if a user is an admin of the group.
+// The user lookup and the admin check travel in one query: a var block
+// resolves the user's UID server-side and feeds it into the group
+// filter, halving the round trips. A user that doesn't exist is simply
+// not an admin.
 func (c *Client) IsGroupAdmin(ctx context.Context, groupNamespace, userID string) (bool, error) {
-	userNode, err := c.FindNodeByName(ctx, fmt.Sprintf("user_%s", userID), userID, NodeTypeUser)
-	if err != nil || userNode == nil {
-		return false, fmt.Errorf("user not found: %s", userID)
-	}
-
-	query := `query IsAdmin($ns: string, $user: string) {
-		g(func: eq(namespace, $ns)) @filter(uid_in(group_has_admin, $user)) {
+	query := `query IsAdmin($ns: string, $user: string, $userns: string) {
+		u as var(func: eq(name, $user)) @filter(type(User) AND eq(namespace, $userns))
+		g(func: eq(namespace, $ns)) @filter(uid_in(group_has_admin, uid(u))) {
 			uid
 		}
 	}`
 
 	resp, err := c.Query(ctx, query, map[string]string{
-		"$ns":   groupNamespace,
-		"$user": userNode.UID,
+		"$ns":     groupNamespace,
+		"$user":   userID,
+		"$userns": fmt.Sprintf("user_%s", userID),
 	})
 	if err != nil {
 		return false, err
@@ -1713,54 +1729,70 @@ func (c *Client) FindEntityInNamespace(ctx context.Context, name, namespace stri
 
 // findEntityFuzzy performs fuzzy matching using Levenshtein distance
 // Returns entities with distance <= 2 (for shorter names) or <= 3 (for longer names)
+//
+// Levenshtein can't be pushed into DGraph, but the candidate scan only
+// needs names: pages of uid/name pairs stream through instead of every
+// full node record in the namespace, and the winner's record is fetched
+// by UID at the end. Memory stays bounded by the page size and the wire
+// carries a fraction of the bytes.
 func (c *Client) findEntityFuzzy(ctx context.Context, name, namespace string) (*Node, error) {
-	// Query all entities in namespace for fuzzy comparison
-	query := `query FindAll($ns: string) {
-		node(func: eq(namespace, $ns)) @filter(has(name)) {
+	query := `query FindAll($ns: string, $first: int, $offset: int) {
+		node(func: eq(namespace, $ns), first: $first, offset: $offset) @filter(has(name)) {
 			uid
-			dgraph.type
 			name
-			description
-			namespace
-			activation
-			created_at
 		}
 	}`
 
-	vars := map[string]string{"$ns": namespace}
-	resp, err := c.dg.NewReadOnlyTxn().QueryWithVars(ctx, query, vars)
-	if err != nil {
-		return nil, err
-	}
-
-	var result struct {
-		Node []Node `json:"node"`
-	}
-	if err := json.Unmarshal(resp.Json, &result); err != nil {
-		return nil, err
-	}
-
 	// Calculate max allowed distance based on name length
 	maxDist := 2
 	if len(name) > 10 {
 		maxDist = 3
 	}
 
-	// Find closest match
-	var closestNode *Node
+	const pageSize = 1000
+	bestUID := ""
 	minDistance := maxDist + 1
 
-	for _, node := range result.Node {
-		normalizedNodeName := normalizeForMatching(node.Name)
-		distance := levenshteinDistance(name, normalizedNodeName)
+	for offset := 0; ; offset += pageSize {
+		vars := map[string]string{
+			"$ns":     namespace,
+			"$first":  fmt.Sprintf("%d", pageSize),
+			"$offset": fmt.Sprintf("%d", offset),
+		}
+		resp, err := c.dg.NewReadOnlyTxn().QueryWithVars(ctx, query, vars)
+		if err != nil {
+			return nil, err
+		}
+
+		var result struct {
+			Node []struct {
+				UID  string `json:"uid"`
+				Name string `json:"name"`
+			} `json:"node"`
+		}
+		if err := json.Unmarshal(resp.Json, &result); err != nil {
+			return nil, err
+		}
+
+		for _, node := range result.Node {
+			normalizedNodeName := normalizeForMatching(node.Name)
+			distance := levenshteinDistance(name, normalizedNodeName)
+
+			if distance <= maxDist && distance < minDistance {
+				minDistance = distance
+				bestUID = node.UID
+			}
+		}
 
-		if distance <= maxDist && distance < minDistance {
-			minDistance = distance
-			closestNode = &node
+		if len(result.Node) < pageSize {
+			break
 		}
 	}
 
-	return closestNode, nil
+	if bestUID == "" {
+		return nil, nil
+	}
+	return c.GetNode(ctx, bestUID)
 }
 
 // normalizeForMatching normalizes text for entity matching
@@ -9,6 +9,7 @@ import (
 	"fmt"
 	"regexp"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/reflective-memory-kernel/internal/ai/router"
@@ -91,6 +92,10 @@ type IngestRequest struct {
 	Filename      string `json:"filename,omitempty"`
 }
 
+// llmExtractConcurrency bounds how many tier-3 LLM extraction calls run
+// at once so a large document doesn't flood the provider
+const llmExtractConcurrency = 4
+
 // Config configures the ingester
 type Config struct {
 	ChunkSize      int
@@ -161,22 +166,30 @@ func (s *Service) IngestText(ctx context.Context, text string, filename string)
 
 // IngestBase64Content ingests base64-encoded content
 func (s *Service) IngestBase64Content(ctx context.Context, contentB64, docType, filename string) (*IngestionResult, error) {
+	// Decode once; validation below runs on the decoded bytes
+	content, err := base64.StdEncoding.DecodeString(contentB64)
+	if err != nil {
+		return nil, fmt.Errorf("failed to decode base64: %w", err)
+	}
+
+	return s.IngestContent(ctx, content, docType, filename)
+}
+
+// IngestContent ingests already-decoded file content. Callers that decode
+// (or receive) raw bytes themselves use this to avoid holding a second
+// copy of the payload alongside its base64 form. Processing is entirely
+// in-memory: no temp file is written and nothing touches disk.
+func (s *Service) IngestContent(ctx context.Context, content []byte, docType, filename string) (*IngestionResult, error) {
 	start := time.Now()
 
 	// Validate file if filename provided
 	if filename != "" {
-		result := s.validator.ValidateBase64Content(contentB64, filename)
+		result := s.validator.ValidateContent(content, filename)
 		if !result.Valid {
 			return nil, fmt.Errorf("file validation failed: %s", result.ErrorMessage)
 		}
 	}
 
-	// Decode content
-	content, err := base64.StdEncoding.DecodeString(contentB64)
-	if err != nil {
-		return nil, fmt.Errorf("failed to decode base64: %w", err)
-	}
-
 	if docType == "pdf" || strings.HasSuffix(filename, ".pdf") {
 		// For PDF, we'd extract text and images
 		// For now, treat as text since we don't have PDF parser
@@ -236,9 +249,28 @@ func (s *Service) processDocument(ctx context.Context, pages []PageInfo, images
 			maxLLM = len(clusterReps)
 		}
 
-		for _, chunk := range clusterReps[:maxLLM] {
-			llmEntities, err := s.extractWithLLM(ctx, chunk.Text)
-			if err == nil && len(llmEntities) > 0 {
+		// Each extraction is an independent LLM round trip, so fan them
+		// out concurrently (bounded) instead of paying maxLLM RTTs in
+		// series; per-chunk results keep their slot so output order is
+		// deterministic
+		sem := make(chan struct{}, llmExtractConcurrency)
+		chunkEntities := make([][]Entity, maxLLM)
+		var wg sync.WaitGroup
+		for i, chunk := range clusterReps[:maxLLM] {
+			wg.Add(1)
+			go func(i int, text string) {
+				defer wg.Done()
+				sem <- struct{}{}
+				defer func() { <-sem }()
+				if llmEntities, err := s.extractWithLLM(ctx, text); err == nil {
+					chunkEntities[i] = llmEntities
+				}
+			}(i, chunk.Text)
+		}
+		wg.Wait()
+
+		for _, llmEntities := range chunkEntities {
+			if len(llmEntities) > 0 {
 				entities = append(entities, llmEntities...)
 				llmCalls++
 			}
@@ -542,18 +574,19 @@ func (s *Service) calculateComplexity(imageBase64 string) float64 {
 	return minFloat64(float64(size)/100000*10, 10.0)
 }
 
-// deduplicateEntities removes duplicate entities
+// deduplicateEntities removes duplicate entities, tallying occurrence
+// counts in a single pass over the input
 func (s *Service) deduplicateEntities(entities []Entity) []Entity {
-	seen := make(map[string]*Entity)
-	unique := make([]Entity, 0)
+	index := make(map[string]int, len(entities))
+	unique := make([]Entity, 0, len(entities))
 
 	for _, entity := range entities {
 		key := strings.ToLower(entity.Name) + "|" + entity.EntityType
-		if existing, ok := seen[key]; ok {
-			existing.Count++
+		if i, ok := index[key]; ok {
+			unique[i].Count++
 		} else {
-			seen[key] = &entity
 			entity.Count = 1
+			index[key] = len(unique)
 			unique = append(unique, entity)
 		}
 	}
@@ -635,18 +668,51 @@ func ExtractEntities(text string) []Entity {
 	return ingester.extractRules(text)
 }
 
-// ChunkText splits text into chunks
-func ChunkText(text string, chunkSize, overlap int) []Chunk {
-	cfg := &chunking.Config{
+// chunkTextKey identifies the configuration a cached ChunkText chunker
+// was built for
+type chunkTextKey struct {
+	chunkSize int
+	overlap   int
+}
+
+// chunkTextCache reuses chunkers across ChunkText calls so the derived
+// matcher state is built once per (chunk size, overlap) pair instead of
+// per call. Chunkers are read-only after construction and safe to share.
+var (
+	chunkTextMu    sync.Mutex
+	chunkTextCache = map[chunkTextKey]*chunking.Chunker{}
+)
+
+// chunkTextCacheMax bounds the config cache; it is cleared wholesale in
+// the unlikely case callers produce more distinct configs than this
+const chunkTextCacheMax = 64
+
+func chunkerFor(chunkSize, overlap int) *chunking.Chunker {
+	key := chunkTextKey{chunkSize: chunkSize, overlap: overlap}
+
+	chunkTextMu.Lock()
+	defer chunkTextMu.Unlock()
+	if chunker, ok := chunkTextCache[key]; ok {
+		return chunker
+	}
+
+	chunker := chunking.New(&chunking.Config{
 		ChunkSize:       chunkSize,
 		Overlap:         overlap,
 		MinChunkSize:    50,
 		ForwardFallback: true,
 		RespectSentence: true,
+	})
+	if len(chunkTextCache) >= chunkTextCacheMax {
+		chunkTextCache = map[chunkTextKey]*chunking.Chunker{}
 	}
+	chunkTextCache[key] = chunker
+	return chunker
+}
 
-	chunker := chunking.New(cfg)
-	results := chunker.Chunk(text)
+// ChunkText splits text into chunks
+func ChunkText(text string, chunkSize, overlap int) []Chunk {
+	results := chunkerFor(chunkSize, overlap).Chunk(text)
 
 	chunks := make([]Chunk, len(results))
 	for i, r := range results {
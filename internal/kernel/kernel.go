@@ -531,7 +531,7 @@ func (k *Kernel) runIngestionLoop() {
 			}
 		}()
 
-		k.logger.Info("=== RECEIVED NATS MESSAGE ===",
+		k.logger.Debug("Received NATS message",
 			zap.String("subject", msg.Subject),
 			zap.Int("data_len", len(msg.Data)))
 
@@ -610,7 +610,7 @@ func (k *Kernel) runIngestionLoop() {
 				retryCountMu.Unlock()
 			}
 
-			k.logger.Info("Successfully processed transcript",
+			k.logger.Debug("Successfully processed transcript",
 				zap.String("subject", msg.Subject))
 			msg.Ack()
 		}
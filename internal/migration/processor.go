@@ -6,6 +6,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"io"
 	"net/http"
 	"sync"
 	"time"
@@ -224,6 +225,9 @@ func (p *Processor) cognifyBatch(ctx context.Context, points []DataPoint) ([]Cog
 		return nil, err
 	}
 	req.Header.Set("Content-Type", "application/json")
+	// Ask for NDJSON so results decode one at a time off the wire
+	// instead of as one monolithic array
+	req.Header.Set("Accept", "application/x-ndjson")
 
 	resp, err := p.httpClient.Do(req)
 	if err != nil {
@@ -235,9 +239,26 @@ func (p *Processor) cognifyBatch(ctx context.Context, points []DataPoint) ([]Cog
 		return nil, fmt.Errorf("AI service returned status %d - NO FALLBACK", resp.StatusCode)
 	}
 
-	var results []CognifyResult
-	if err := json.NewDecoder(resp.Body).Decode(&results); err != nil {
-		return nil, fmt.Errorf("failed to decode AI response - NO FALLBACK: %w", err)
+	decoder := json.NewDecoder(resp.Body)
+	if resp.Header.Get("Content-Type") != "application/x-ndjson" {
+		// Older AI service: plain JSON array
+		var results []CognifyResult
+		if err := decoder.Decode(&results); err != nil {
+			return nil, fmt.Errorf("failed to decode AI response - NO FALLBACK: %w", err)
+		}
+		return results, nil
+	}
+
+	results := make([]CognifyResult, 0, len(points))
+	for {
+		var result CognifyResult
+		if err := decoder.Decode(&result); err != nil {
+			if err == io.EOF {
+				break
+			}
+			return nil, fmt.Errorf("failed to decode AI response - NO FALLBACK: %w", err)
+		}
+		results = append(results, result)
 	}
 
 	return results, nil
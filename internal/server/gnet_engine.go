@@ -57,6 +57,13 @@ type Options struct {
 	// Enable multi-core event loops (default: true)
 	Multicore bool
 
+	// Number of event loops (default: 0 = one per CPU when Multicore)
+	NumEventLoops int
+
+	// Enable SO_REUSEPORT so multiple processes can share the listen
+	// address and the kernel balances accepts (default: true)
+	ReusePort bool
+
 	// Read-only mode (default: false)
 	ReadOnly bool
 
@@ -99,6 +106,7 @@ func DefaultOptions() *Options {
 	return &Options{
 		Network:        "tcp",
 		Multicore:      true,
+		ReusePort:      true,
 		ReadOnly:       false,
 		LingerTimeout:  time.Second,
 		ReadBufferSize: 4096,
@@ -321,12 +329,19 @@ func (e *Engine) HandleFunc(path string, handler HandlerFunc) {
 
 // Start starts the gnet server
 func (e *Engine) Start() error {
-	// Configure gnet options
+	// Configure gnet options. TCP_NODELAY matters for the small JSON
+	// responses this server mostly sends; SO_REUSEPORT lets additional
+	// processes share the port for kernel-balanced accepts.
 	gnetOpts := []gnet.Option{
 		gnet.WithMulticore(e.multicore),
+		gnet.WithReusePort(e.options.ReusePort),
+		gnet.WithTCPNoDelay(gnet.TCPNoDelay),
 		gnet.WithLogLevel(logging.ErrorLevel), // Reduce noise
 		gnet.WithLogger(newGnetLoggerAdapter(e.logger)),
 	}
+	if e.options.NumEventLoops > 0 {
+		gnetOpts = append(gnetOpts, gnet.WithNumEventLoop(e.options.NumEventLoops))
+	}
 
 	// Start the server
 	var err error
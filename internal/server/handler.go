@@ -2,7 +2,6 @@ package server
 
 import (
 	"bytes"
-	"encoding/json"
 	"fmt"
 	"io"
 	"net/http"
@@ -369,9 +368,10 @@ func MetricsHandler(getMetrics func() string) HandlerFunc {
 	}
 }
 
-// ParseJSON parses the request body as JSON
+// ParseJSON parses the request body as JSON using sonic, matching the
+// serialization path so large bodies are decoded in a single fast pass
 func ParseJSON(req *Request, v interface{}) error {
-	return json.Unmarshal(req.Body, v)
+	return JSONUnmarshal(req.Body, v)
 }
 
 // WriteJSON writes JSON to the response
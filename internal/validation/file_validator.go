@@ -118,13 +118,7 @@ func New(maxSize, minSize, maxFilenameLen int) *FileValidator {
 
 // ValidateBase64Content validates a base64-encoded file content
 func (v *FileValidator) ValidateBase64Content(contentB64, filename string) ValidationResult {
-	// Step 1: Validate filename first
-	filenameResult := v.ValidateFilename(filename)
-	if !filenameResult.Valid {
-		return filenameResult
-	}
-
-	// Step 2: Check base64 length before decoding
+	// Step 1: Check base64 length before decoding
 	maxB64Length := (v.maxFileSize * 4 / 3) + 100
 	if len(contentB64) > maxB64Length {
 		return ValidationResult{
@@ -142,7 +136,7 @@ func (v *FileValidator) ValidateBase64Content(contentB64, filename string) Valid
 		}
 	}
 
-	// Step 3: Decode base64
+	// Step 2: Decode base64
 	fileContent, err := base64.StdEncoding.DecodeString(contentB64)
 	if err != nil {
 		return ValidationResult{
@@ -152,7 +146,19 @@ func (v *FileValidator) ValidateBase64Content(contentB64, filename string) Valid
 		}
 	}
 
-	// Step 4: Check file size
+	return v.ValidateContent(fileContent, filename)
+}
+
+// ValidateContent validates already-decoded file content. Callers that
+// decode the payload themselves can use this to avoid a second decode.
+func (v *FileValidator) ValidateContent(fileContent []byte, filename string) ValidationResult {
+	// Step 1: Validate filename first
+	filenameResult := v.ValidateFilename(filename)
+	if !filenameResult.Valid {
+		return filenameResult
+	}
+
+	// Step 2: Check file size
 	fileSize := len(fileContent)
 	if fileSize > v.maxFileSize {
 		return ValidationResult{
@@ -170,7 +176,7 @@ func (v *FileValidator) ValidateBase64Content(contentB64, filename string) Valid
 		}
 	}
 
-	// Step 5: Validate file extension
+	// Step 3: Validate file extension
 	ext := v.getExtension(filename)
 	ext = strings.ToLower(ext)
 	if _, ok := v.allowedExtensions[ext]; !ok {
@@ -181,7 +187,7 @@ func (v *FileValidator) ValidateBase64Content(contentB64, filename string) Valid
 		}
 	}
 
-	// Step 6: Magic number verification
+	// Step 4: Magic number verification
 	if !v.verifyMagicNumber(fileContent, ext) {
 		return ValidationResult{
 			Valid:        false,
@@ -190,7 +196,7 @@ func (v *FileValidator) ValidateBase64Content(contentB64, filename string) Valid
 		}
 	}
 
-	// Step 7: Check for suspicious content patterns
+	// Step 5: Check for suspicious content patterns
 	suspicious := v.checkSuspiciousPatterns(fileContent)
 	if len(suspicious) > 0 {
 		return ValidationResult{
@@ -1,5 +1,10 @@
 // Package vectorindex provides neural compression for vector representations
 // This is the Go port of ai/vector_index/compressor.py
+//
+// All arithmetic here is plain float64 on the CPU; there is no
+// accelerator or reduced-precision backend to configure, so throughput
+// comes from the fused single-pass pooling loops rather than numerics
+// settings.
 package vectorindex
 
 import (
@@ -29,6 +34,11 @@ type CompressorConfig struct {
 	HiddenDim   int               `json:"hidden_dim"`
 	Method      CompressionMethod `json:"method"`
 	UseLayerNorm bool              `json:"use_layer_norm"`
+	// SkipOutputNorm drops the final unit-normalization pass. Callers
+	// feeding an index that renormalizes vectors itself (or batches the
+	// normalization over a whole layer) can skip the per-call pass; the
+	// zero value keeps the normalizing behavior.
+	SkipOutputNorm bool `json:"skip_output_norm"`
 }
 
 // DefaultCompressorConfig returns default compression configuration
@@ -83,9 +93,12 @@ func (c *Compressor) Compress(vectors []Vector) []float64 {
 		result := make([]float64, c.config.InputDim)
 		copy(result, vectors[0])
 		if c.config.UseLayerNorm {
-			result = c.layerNorm(result)
+			c.layerNormRow(result)
 		}
-		return normalize(result)
+		if !c.config.SkipOutputNorm {
+			normalizeRow(result)
+		}
+		return result
 	}
 
 	var compressed []float64
@@ -103,20 +116,25 @@ func (c *Compressor) Compress(vectors []Vector) []float64 {
 		compressed = c.weightedMeanPool(vectors)
 	}
 
-	// Apply layer normalization if enabled
+	// Apply layer normalization if enabled, then unit-normalize, both in
+	// place on the freshly pooled vector — no intermediate copies
 	if c.config.UseLayerNorm {
-		compressed = c.layerNorm(compressed)
+		c.layerNormRow(compressed)
 	}
 
-	// Normalize to unit length (crucial for cosine similarity)
-	return normalize(compressed)
+	// Normalize to unit length (crucial for cosine similarity) unless the
+	// caller renormalizes downstream
+	if !c.config.SkipOutputNorm {
+		normalizeRow(compressed)
+	}
+	return compressed
 }
 
-// meanPool performs simple mean pooling
+// meanPool performs simple mean pooling, accumulating straight into the
+// returned vector instead of staging through a pooled buffer and copying
 func (c *Compressor) meanPool(vectors []Vector) []float64 {
 	dim := c.config.InputDim
-	result := c.getBuffer()
-	defer c.putBuffer(result)
+	result := make([]float64, dim)
 
 	for _, vec := range vectors {
 		for i := 0; i < dim; i++ {
@@ -129,10 +147,7 @@ func (c *Compressor) meanPool(vectors []Vector) []float64 {
 		result[i] /= count
 	}
 
-	// Copy to return value
-	output := make([]float64, dim)
-	copy(output, result)
-	return output
+	return result
 }
 
 // weightedMeanPool performs attention-weighted mean pooling
@@ -154,23 +169,26 @@ func (c *Compressor) weightedMeanPool(vectors []Vector) []float64 {
 		centroid[i] /= float64(n)
 	}
 
-	// Normalize centroid
-	centroid = normalize(centroid)
+	// Normalize centroid in place; the pooled buffer is the working copy
+	normalizeRow(centroid)
 
 	// Compute attention weights based on cosine similarity to centroid
 	weights := make([]float64, n)
 	sumWeights := 0.0
 
 	for i, vec := range vectors {
-		// Normalize vector for similarity computation
-		normVec := make([]float64, dim)
-		copy(normVec, vec)
-		normVec = normalize(normVec)
-
-		// Cosine similarity = dot product for normalized vectors
-		similarity := 0.0
+		// Cosine similarity against the unit centroid: accumulate the
+		// dot and the vector's own squared norm in one pass and divide,
+		// instead of materializing a normalized copy of every vector
+		dot := 0.0
+		normSq := 0.0
 		for j := 0; j < dim; j++ {
-			similarity += normVec[j] * centroid[j]
+			dot += vec[j] * centroid[j]
+			normSq += vec[j] * vec[j]
+		}
+		similarity := 0.0
+		if normSq > 0 {
+			similarity = dot / math.Sqrt(normSq)
 		}
 
 		// Apply softmax-like transformation
@@ -179,19 +197,16 @@ func (c *Compressor) weightedMeanPool(vectors []Vector) []float64 {
 		sumWeights += weights[i]
 	}
 
-	// Normalize weights
-	if sumWeights > 0 {
-		for i := range weights {
-			weights[i] /= sumWeights
-		}
-	} else {
+	// Weighted mean with the softmax denominator folded into one final
+	// scale, instead of renormalizing the weights array in its own pass
+	if sumWeights <= 0 {
 		// Fallback to uniform weights
+		sumWeights = float64(n)
 		for i := range weights {
-			weights[i] = 1.0 / float64(n)
+			weights[i] = 1.0
 		}
 	}
 
-	// Compute weighted mean
 	result := make([]float64, dim)
 	for i, vec := range vectors {
 		weight := weights[i]
@@ -200,6 +215,11 @@ func (c *Compressor) weightedMeanPool(vectors []Vector) []float64 {
 		}
 	}
 
+	inv := 1.0 / sumWeights
+	for j := 0; j < dim; j++ {
+		result[j] *= inv
+	}
+
 	return result
 }
 
@@ -226,27 +246,42 @@ func (c *Compressor) maxPool(vectors []Vector) []float64 {
 }
 
 // hybridPool combines mean and max pooling
-// Takes weighted average of both methods
+// Takes weighted average of both methods, accumulating the sum and the
+// running maximum in one fused pass over the cluster instead of running
+// meanPool and maxPool separately and blending a third buffer
 func (c *Compressor) hybridPool(vectors []Vector) []float64 {
 	dim := c.config.InputDim
 
-	mean := c.meanPool(vectors)
-	max := c.maxPool(vectors)
+	sum := c.getBuffer()
+	defer c.putBuffer(sum)
 
+	// result carries the running maximum until the final blend
 	result := make([]float64, dim)
-	alpha := 0.7 // Weight for mean pooling
+	for i := 0; i < dim; i++ {
+		result[i] = vectors[0][i]
+		sum[i] = vectors[0][i]
+	}
+	for _, vec := range vectors[1:] {
+		for i := 0; i < dim; i++ {
+			sum[i] += vec[i]
+			if vec[i] > result[i] {
+				result[i] = vec[i]
+			}
+		}
+	}
 
+	alpha := 0.7 // Weight for mean pooling
+	invCount := 1.0 / float64(len(vectors))
 	for i := 0; i < dim; i++ {
-		result[i] = alpha*mean[i] + (1-alpha)*max[i]
+		result[i] = alpha*sum[i]*invCount + (1-alpha)*result[i]
 	}
 
 	return result
 }
 
-// layerNorm applies layer normalization to a vector
-func (c *Compressor) layerNorm(x []float64) []float64 {
+// layerNormRow applies layer normalization to a vector in place
+func (c *Compressor) layerNormRow(x []float64) {
 	dim := c.config.InputDim
-	result := make([]float64, dim)
 
 	// Compute mean
 	mean := 0.0
@@ -269,10 +304,8 @@ func (c *Compressor) layerNorm(x []float64) []float64 {
 
 	// Normalize
 	for i := 0; i < dim; i++ {
-		result[i] = (x[i] - mean) / stdDev
+		x[i] = (x[i] - mean) / stdDev
 	}
-
-	return result
 }
 
 
@@ -304,26 +337,42 @@ func (c *Compressor) putBuffer(buf []float64) {
 // Vector represents a single embedding vector
 type Vector []float64
 
-// CompressClusters is a convenience function for simple compression
-func CompressClusters(clusters [][]Vector, dim int) [][]float64 {
-	cfg := &CompressorConfig{
+// compressorCache reuses convenience compressors per dimension, so the
+// setup (config, buffer pool) happens once instead of on every call.
+// Compressors hold no per-call state and are safe to share. Callers that
+// compress repeatedly (ingestion loops, benchmarks) should go through
+// compressorFor rather than constructing a NewCompressor per run.
+var (
+	compressorMu    sync.Mutex
+	compressorCache = map[int]*Compressor{}
+)
+
+// compressorFor returns the cached default-config compressor for the
+// given dimension, constructing it on first use
+func compressorFor(dim int) *Compressor {
+	compressorMu.Lock()
+	defer compressorMu.Unlock()
+	if compressor, ok := compressorCache[dim]; ok {
+		return compressor
+	}
+
+	compressor := NewCompressor(&CompressorConfig{
 		InputDim:     dim,
 		Method:       CompressionWeightedMean,
 		UseLayerNorm: true,
-	}
-	compressor := NewCompressor(cfg, nil)
-	return compressor.CompressBatch(clusters)
+	}, nil)
+	compressorCache[dim] = compressor
+	return compressor
+}
+
+// CompressClusters is a convenience function for simple compression
+func CompressClusters(clusters [][]Vector, dim int) [][]float64 {
+	return compressorFor(dim).CompressBatch(clusters)
 }
 
 // CompressSingleCluster compresses a single cluster of vectors
 func CompressSingleCluster(vectors []Vector, dim int) []float64 {
-	cfg := &CompressorConfig{
-		InputDim:     dim,
-		Method:       CompressionWeightedMean,
-		UseLayerNorm: true,
-	}
-	compressor := NewCompressor(cfg, nil)
-	return compressor.Compress(vectors)
+	return compressorFor(dim).Compress(vectors)
 }
 
 // AttentionWeights computes attention weights for vectors based on their similarity
@@ -336,25 +385,25 @@ func (c *Compressor) AttentionWeights(vectors []Vector, query []float64) []float
 		return nil
 	}
 
-	// Normalize query
-	queryNorm := make([]float64, dim)
-	copy(queryNorm, query)
-	queryNorm = normalize(query)
+	// Normalize query (normalize already returns a copy)
+	queryNorm := normalize(query)
 
 	// Compute similarities
 	weights := make([]float64, n)
 	sumWeights := 0.0
 
 	for i, vec := range vectors {
-		// Normalize vector
-		vecNorm := make([]float64, dim)
-		copy(vecNorm, vec)
-		vecNorm = normalize(vecNorm)
-
-		// Dot product (cosine similarity for normalized vectors)
-		similarity := 0.0
+		// Cosine similarity without a normalized copy per vector: fuse
+		// the dot against the unit query with the vector's squared norm
+		dot := 0.0
+		normSq := 0.0
 		for j := 0; j < dim; j++ {
-			similarity += vecNorm[j] * queryNorm[j]
+			dot += vec[j] * queryNorm[j]
+			normSq += vec[j] * vec[j]
+		}
+		similarity := 0.0
+		if normSq > 0 {
+			similarity = dot / math.Sqrt(normSq)
 		}
 
 		// Softmax with temperature
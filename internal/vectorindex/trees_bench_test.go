@@ -0,0 +1,59 @@
+// Package vectorindex benchmarks for hierarchical tree construction and
+// search at the chunk counts the index is sized for.
+package vectorindex
+
+import (
+	"fmt"
+	"math/rand"
+	"testing"
+)
+
+// benchDim keeps benchmark vectors large enough to exercise the flat
+// matrix paths without dominating run time
+const benchDim = 256
+
+// benchChunks builds n dummy chunks whose embeddings are rows sliced out
+// of one flat random matrix, instead of allocating and filling a vector
+// per chunk
+func benchChunks(n int) []Chunk {
+	rng := rand.New(rand.NewSource(42))
+	flat := make([]float64, n*benchDim)
+	for i := range flat {
+		flat[i] = rng.Float64()
+	}
+
+	chunks := make([]Chunk, n)
+	for i := range chunks {
+		chunks[i] = Chunk{
+			Text:      fmt.Sprintf("chunk %d", i),
+			Embedding: flat[i*benchDim : (i+1)*benchDim : (i+1)*benchDim],
+		}
+	}
+	return chunks
+}
+
+func benchmarkBuildIndex(b *testing.B, n int) {
+	chunks := benchChunks(n)
+	builder := NewIndexBuilder(10, benchDim, nil)
+	b.ResetTimer()
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		_ = builder.BuildIndex(chunks)
+	}
+}
+
+func BenchmarkBuildIndex100(b *testing.B)  { benchmarkBuildIndex(b, 100) }
+func BenchmarkBuildIndex1000(b *testing.B) { benchmarkBuildIndex(b, 1000) }
+
+func BenchmarkSearch1000(b *testing.B) {
+	chunks := benchChunks(1000)
+	builder := NewIndexBuilder(10, benchDim, nil)
+	tree := builder.BuildIndex(chunks)
+	query := benchChunks(1)[0].Embedding
+
+	b.ResetTimer()
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		_ = builder.Search(tree, query, 5)
+	}
+}
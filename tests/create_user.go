@@ -14,14 +14,13 @@ import (
 
 func main() {
 	logger, _ := zap.NewDevelopment()
-	cfg := graph.DefaultClientConfig()
-	cfg.Address = "localhost:19080" // gRPC port
 
 	ctx := context.Background()
-	client, err := graph.NewClient(ctx, cfg, logger)
+	client, err := graph.NewLocalClient(ctx, "localhost:19080", logger)
 	if err != nil {
 		log.Fatalf("Failed to connect to DGraph: %v", err)
 	}
+	defer client.Close()
 
 	// Execute Mutation
 	logger.Info("Creating user node...")
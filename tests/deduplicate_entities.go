@@ -12,7 +12,6 @@ import (
 
 	"github.com/dgraph-io/dgo/v240/protos/api"
 	"github.com/reflective-memory-kernel/internal/graph"
-	"go.uber.org/zap"
 )
 
 type NodeData struct {
@@ -30,15 +29,12 @@ type NodeData struct {
 }
 
 func main() {
-	logger, _ := zap.NewDevelopment()
-	cfg := graph.DefaultClientConfig()
-	cfg.Address = "localhost:19080" // gRPC port
-
 	ctx := context.Background()
-	client, err := graph.NewClient(ctx, cfg, logger)
+	client, err := graph.NewLocalClient(ctx, "localhost:19080", nil)
 	if err != nil {
 		log.Fatalf("Failed to connect to DGraph: %v", err)
 	}
+	defer client.Close()
 
 	targetName := "Sarah"
 	fmt.Printf("🔍 Scanning for duplicates of '%s'...\n", targetName)